@@ -6,9 +6,6 @@ if __name__ == "__main__":
     g = Game()  # creates game object
 
     while g.running:
-        if g.playing:
-            g.game_functions()
-        else:
-            g.events()
+        g.scene.tick()  # Runs whatever the game is doing, like playing a map or showing a menu
 
     pygame.quit()
@@ -0,0 +1,108 @@
+"""Contains the asset manager, which decodes images and sounds on a pool of background threads so that the game doesn't
+sit waiting for each file one after the other while it starts. Loading an asset gives back a future straight away, and
+the asset is only waited for the first time something actually needs it. Assets that only some screens use (like the
+rules image) aren't loaded at startup at all, just shortly before they might be needed.
+
+Every asset's decode time, and how long the game had to wait for it, is kept for the startup report, which can be
+printed with: python -m misc.assets"""
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+import pygame
+from pygame import mixer
+
+from misc.constants import ASSET_LOADER_THREADS
+
+
+class AssetManager:
+    """Loads each file once, on a background thread, and keeps what it was decoded into"""
+    def __init__(self):
+        self.start_time = perf_counter()
+        self.first_frame_time = None  # Seconds from the start until the first frame was shown
+        self.executor = ThreadPoolExecutor(ASSET_LOADER_THREADS, thread_name_prefix="asset loader")
+        self.futures = {}  # file path -> Future of what it is decoded into
+        self.assets = {}  # file path -> the finished asset, once it has been asked for
+        self.timings = {}  # file path -> {"decode_ms": ..., "wait_ms": ..., "needed_for_first_frame": ...}
+
+    def preload_image(self, path: str):
+        """Starts decoding the image in the background, if that hasn't already been done. Returns its future."""
+        return self.submit(path, pygame.image.load)
+
+    def preload_sound(self, path: str):
+        """Starts decoding the sound in the background (if the mixer has started). Returns its future."""
+        return self.submit(path, mixer.Sound)
+
+    def submit(self, path: str, load):
+        if path not in self.futures:
+            self.timings[path] = {"decode_ms": None, "wait_ms": 0, "needed_for_first_frame": False}
+            self.futures[path] = self.executor.submit(self.decode, path, load)
+        return self.futures[path]
+
+    def decode(self, path: str, load):
+        """Run on a background thread"""
+        start = perf_counter()
+        try:
+            return load(path)
+        finally:
+            self.timings[path]["decode_ms"] = round((perf_counter() - start) * 1000, 3)
+
+    def get_image(self, path: str, alpha: bool = False) -> pygame.Surface:
+        """Returns the image, waiting for it to finish decoding if it hasn't yet. Converting to the display's pixel
+        format has to happen on the main thread, so it is done here the first time."""
+        if path not in self.assets:
+            image = self.wait_for(path, self.preload_image(path))
+            self.assets[path] = image.convert_alpha() if alpha else image.convert()
+        return self.assets[path]
+
+    def get_sound(self, path: str):
+        """Returns the sound, waiting for it to finish decoding if it hasn't yet"""
+        if path not in self.assets:
+            self.assets[path] = self.wait_for(path, self.preload_sound(path))
+        return self.assets[path]
+
+    def is_ready(self, path: str) -> bool:
+        """Whether the asset has finished decoding, so getting it won't have to wait"""
+        return path in self.futures and self.futures[path].done()
+
+    def wait_for(self, path: str, future):
+        start = perf_counter()
+        asset = future.result()  # Raises whatever the decoding raised, like a missing file
+        self.timings[path]["wait_ms"] += round((perf_counter() - start) * 1000, 3)
+        if self.first_frame_time is None:
+            self.timings[path]["needed_for_first_frame"] = True
+        return asset
+
+    def first_frame_shown(self):
+        """Run whenever a frame has been shown, only the first time counts"""
+        if self.first_frame_time is None:
+            self.first_frame_time = perf_counter() - self.start_time
+
+    def get_report(self) -> dict:
+        """Startup report: how long until the first frame was shown, and for each asset how long it took to decode (on
+        a background thread) and how long the main thread waited for it. Times are in milliseconds, and decode_ms is
+        None if the asset is still being decoded."""
+        return {"time_to_first_frame_ms": None if self.first_frame_time is None else
+                round(self.first_frame_time * 1000, 3),
+                "asset_threads": ASSET_LOADER_THREADS,
+                "total_wait_ms": round(sum(timing["wait_ms"] for timing in self.timings.values()), 3),
+                "assets": dict(sorted(self.timings.items()))}
+
+
+assets = AssetManager()
+
+
+if __name__ == "__main__":
+    from misc.game import Game
+    from misc.maps import MapId
+    from misc.assets import assets  # The one the game uses, as this file is running as __main__ rather than misc.assets
+
+    parser = argparse.ArgumentParser(description="Starts the game headless and prints the startup report.")
+    parser.add_argument("--map", choices=[map_id.name for map_id in MapId],
+                        help="map to start on, instead of the title screen")
+    args = parser.parse_args()
+
+    game = Game(headless=True, start_map_id=MapId[args.map] if args.map else None)
+    game.scene.tick()
+    print(json.dumps(assets.get_report(), indent=2))
@@ -0,0 +1,167 @@
+"""Times how long the game takes to load and play every map, so that builds can be compared and slowdowns caught. The
+game is run headless with the same scripted input every time and the results are printed (or saved) as JSON.
+
+Example: python -m misc.benchmark --ticks 600 --output bench.json
+
+'update' is the time spent updating sprites not counting collisions, which are timed separately under 'collision'.
+'frame' is the whole tick. All times are in milliseconds. 'pixels_updated' is how many pixels were sent to the display
+each tick, which the dirty rectangle renderer keeps down.
+
+Only ticks spent playing the map are measured. Dying starts the map again straight away, and going through a pipe or
+finishing the level goes back to the map being measured. Ticks where a cutscene (like going down a pipe) was playing
+aren't measured, and are counted in 'cutscene_ticks' instead, so every map is played until it has been measured for the
+same number of ticks. 'deaths' is how many times the player died and 'restarts' is how many times the map was started
+again for any reason.
+
+--stress-enemies adds snakes along the ground away from where the player walks until there are that many enemies on
+the map, and keeps adding more before every tick to replace the ones that fall off the map or are killed (or after the
+map is started again). --batched-enemies updates the enemies with the enemy system (see misc/enemy_system.py) so the two
+can be compared. 'stressed_ticks' is how many of the measured ticks still had that many enemies on the map at the end."""
+import argparse
+import json
+import platform
+from math import ceil
+from time import perf_counter
+
+import pygame
+
+from misc.constants import BLOCK_SIZE_X, SCALE_UP
+from misc.game import Game
+from misc.assets import assets
+from misc.enemy_system import EnemySystem, is_available
+from misc.maps import MapId
+from misc.objectives import Objective
+from misc.scripted_input import ScriptedInput
+from sprites.entity_pool import get_pool_stats
+from sprites.all_sprites import Snake
+
+PHASES = ["update", "collision", "draw", "display flip", "frame"]
+BENCHMARK_SCRIPT = "RIGHT*45 RIGHT+SPACE*1 RIGHT*30 -*10 LEFT*45 LEFT+SPACE*1 LEFT*30 -*10"  # Walks back and forth
+STRESS_ENEMY_MARGIN = 12  # Stress enemies are put at least this many tiles to the side of where the player starts
+
+
+def percentile(values: list, percent: float) -> float:
+    """Nearest-rank percentile of the values"""
+    ordered = sorted(values)
+    return ordered[max(0, ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def summarise(times: list) -> dict:
+    """Turns a list of times in seconds into a summary in milliseconds"""
+    if not times:
+        return {}
+    return {"mean": round(sum(times) / len(times) * 1000, 4),
+            "p50": round(percentile(times, 50) * 1000, 4),
+            "p95": round(percentile(times, 95) * 1000, 4),
+            "p99": round(percentile(times, 99) * 1000, 4),
+            "max": round(max(times) * 1000, 4)}
+
+
+def add_stress_enemies(game: Game, count: int):
+    """Adds count snakes spread out along the map, each standing on top of a block away from where the player starts
+    so that they don't walk into the player straight away"""
+    if count <= 0:
+        return
+    player = next(iter(game.player_group))
+    player_column = player.rect.x // (BLOCK_SIZE_X * SCALE_UP)
+    solid = {cell for block in game.blocks_grid for cell in game.blocks_grid.get_cells(block.rect)}
+    spots = sorted((column, row - 1) for column, row in solid
+                   if row > 0 and (column, row - 1) not in solid and abs(column - player_column) >= STRESS_ENEMY_MARGIN)
+    positions = [spots[index * len(spots) // count] for index in range(count)]
+    for snake in Snake.create_instances(game, positions):
+        game.entities_grid.insert(snake)
+    if game.enemy_system is not None:
+        game.enemy_system.load(enemy for enemy in game.enemies_group if enemy in game.all_sprites_group)
+
+
+def benchmark_map(game: Game, map_id: MapId, ticks: int, stress_enemies: int = 0) -> dict:
+    """Loads the map and plays it until it has been measured for the given number of ticks, returning the timings"""
+    game.input_source = ScriptedInput.from_string(BENCHMARK_SCRIPT, loop=True)
+    game.current_map_id = map_id
+    game.num_lives = 7
+
+    start = perf_counter()
+    game.start_map()  # Without the level's name being shown first
+    load_time = perf_counter() - start
+
+    phase_times = {phase: [] for phase in PHASES}
+    pixels_updated = []
+    cutscene_ticks = deaths = restarts = stressed_ticks = 0
+    while len(phase_times["frame"]) < ticks and game.running:
+        if game.current_map_id != map_id or not game.playing:  # Went through a pipe or finished the level
+            game.current_map_id = map_id
+            game.start_map()
+            restarts += 1
+        if stress_enemies:
+            add_stress_enemies(game, stress_enemies - game.objectives.remaining[Objective.ENEMIES])
+
+        start = perf_counter()
+        game.game_functions()
+        frame_time = perf_counter() - start
+
+        section_times = game.profiler.section_times
+        if "cutscene" in section_times:  # Includes the map being started again after the player died
+            cutscene_ticks += 1
+            if game.profiler.counts.get("player deaths"):
+                deaths += 1
+                restarts += 1
+            continue
+        collision_time = section_times.get("collision", 0)
+        phase_times["update"].append(section_times.get("update", 0) - collision_time)
+        phase_times["collision"].append(collision_time)
+        phase_times["draw"].append(section_times.get("draw", 0))
+        phase_times["display flip"].append(section_times.get("display flip", 0))
+        phase_times["frame"].append(frame_time)
+        pixels_updated.append(game.profiler.counts.get("pixels updated", 0))
+        if stress_enemies and game.objectives.remaining[Objective.ENEMIES] >= stress_enemies:
+            stressed_ticks += 1
+
+    return {"load_map_ms": round(load_time * 1000, 4),
+            "create_ms_by_type": {name: round(seconds * 1000, 4) for name, seconds in game.tile_load_times.items()},
+            "ticks": len(phase_times["frame"]),
+            "cutscene_ticks": cutscene_ticks,
+            "deaths": deaths,
+            "restarts": restarts,
+            "stressed_ticks": stressed_ticks,
+            "phases": {phase: summarise(times) for phase, times in phase_times.items()},
+            "pixels_updated": {"mean": round(sum(pixels_updated) / len(pixels_updated)) if pixels_updated else 0,
+                               "max": max(pixels_updated, default=0)}}
+
+
+def run_benchmark(ticks: int, map_ids=None, stress_enemies: int = 0, batched_enemies: bool = False) -> dict:
+    map_ids = map_ids or MapId.get_maps_list()
+    game = Game(headless=True, start_map_id=map_ids[0])
+    game.profiler.enabled = True
+    game.restart_on_death = True
+    if batched_enemies:
+        game.enemy_system = EnemySystem(game)
+
+    report = {"python": platform.python_version(),
+              "pygame": pygame.version.ver,
+              "ticks_per_map": ticks,
+              "stress_enemies": stress_enemies,
+              "batched_enemies": game.enemy_system is not None,
+              "maps": {map_id.name: benchmark_map(game, map_id, ticks, stress_enemies) for map_id in map_ids}}
+    report["entity_pools"] = get_pool_stats()
+    report["startup"] = assets.get_report()
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks loading and playing every map.")
+    parser.add_argument("--ticks", type=int, default=600, help="ticks to measure on each map")
+    parser.add_argument("--maps", nargs="*", choices=[map_id.name for map_id in MapId], help="defaults to every map")
+    parser.add_argument("--stress-enemies", type=int, default=0, help="extra snakes to add to each map")
+    parser.add_argument("--batched-enemies", action="store_true", help="use the enemy system (needs NumPy)")
+    parser.add_argument("--output", help="file to save the JSON to, instead of printing it")
+    args = parser.parse_args()
+    if args.batched_enemies and not is_available():
+        parser.error("--batched-enemies needs NumPy to be installed")
+
+    report = run_benchmark(args.ticks, [MapId[name] for name in args.maps] if args.maps else None,
+                           args.stress_enemies, args.batched_enemies)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
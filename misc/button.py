@@ -1,11 +1,12 @@
 import pygame
 
+from misc.text_cache import render_text
+
 
 class Button:
     """The object for creating a clickable button with text"""
     # fgc = foreground colour, bgc = background colour
     def __init__(self, x, y, width, height, fg_colour, bg_colour, content, fontsize):
-        self.font = pygame.font.Font("courier.ttf", fontsize)
         self.width = width
         self.height = height
 
@@ -18,14 +19,12 @@ class Button:
 
         # Building the text for the button:
         self.content = content  # the words on the button
-        self.text = self.font.render(content, True, fg_colour)  # the text being made into a displayable object
+        self.text = render_text(content, fg_colour, fontsize)  # the text being made into a displayable object (only
+        # rendered the first time, as the menus make their buttons again every time they are shown)
         self.text_rect = self.text.get_rect(center=(width/2, height/2))
 
         self.image.blit(self.text, self.text_rect)  # actually displays them onto the screen
 
-    def is_pressed(self, mouse_pos, pressed) -> bool:
-        """Detects whether the button has been clicked or not"""
-        if self.rect.collidepoint(mouse_pos):
-            if pressed[0]:
-                return True
-        return False
+    def is_clicked(self, event) -> bool:
+        """Detects whether the event is the button being left clicked"""
+        return event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos)
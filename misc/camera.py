@@ -0,0 +1,45 @@
+"""Contains the camera, which decides which part of the map is shown on the screen"""
+import pygame
+
+
+class Camera:
+    """Stores how far the map has been scrolled. Sprites keep their position on the map in their rect and the camera's
+    offset is only added on when they are drawn, so scrolling never has to move every sprite."""
+    def __init__(self):
+        self.x = self.y = 0  # The offset added to every map position to get its position on the screen
+        self.previous_x = self.previous_y = 0  # The offset before the last update
+
+    def save_position(self):
+        """Run before every update, so that drawing can happen part of the way between two updates"""
+        self.previous_x, self.previous_y = self.x, self.y
+
+    def get_interpolated_offset(self, amount: float):
+        """Returns the offset part of the way (amount is from 0 to 1) from before the last update to now"""
+        return (self.previous_x + (self.x - self.previous_x) * amount,
+                self.previous_y + (self.y - self.previous_y) * amount)
+
+    def get_interpolated(self, amount: float):
+        """Returns a camera at the interpolated offset, for drawing between two updates"""
+        camera = Camera()
+        x, y = self.get_interpolated_offset(amount)
+        camera.x, camera.y = round(x), round(y)
+        camera.previous_x, camera.previous_y = camera.x, camera.y
+        return camera
+
+    def move(self, x, y):
+        """Moves everything on the screen by x and y (the camera itself moves the opposite way)"""
+        self.x += int(x)
+        self.y += int(y)
+
+    def apply(self, rect) -> pygame.Rect:
+        """Returns where the rect is on the screen"""
+        return rect.move(self.x, self.y)
+
+    def get_view_rect(self, size, margin: int = 0) -> pygame.Rect:
+        """Returns the part of the map that is on the screen, made bigger on every side by the margin"""
+        return pygame.Rect(-self.x - margin, -self.y - margin, size[0] + margin * 2, size[1] + margin * 2)
+
+    def centre_on(self, rect, desired_x):
+        """Scrolls so that the rect is at desired_x on the screen. Only lateral, as there is no vertical camera
+        movement."""
+        self.x = int(desired_x) - rect.x
@@ -0,0 +1,38 @@
+"""Contains the merged colliders. Static tiles never move or disappear, so instead of every tile being collided with on
+its own, touching tiles are joined together into as few rectangles as possible (like a whole row of ground becoming
+one rectangle). Only collisions use these, the tiles are still drawn one by one."""
+import pygame
+
+
+class Collider:
+    """A rectangle on the map which can be collided with, standing in for the tiles it covers"""
+    def __init__(self, rect: pygame.Rect):
+        self.rect = rect
+
+
+def merge_tiles(tiles, tile_size: int) -> list:
+    """Greedily joins the tiles into rectangles, each one as wide as possible and then as tall as possible. Returns the
+    Colliders, in map order."""
+    solid = {(tile.rect.x // tile_size, tile.rect.y // tile_size) for tile in tiles}
+    merged = set()
+    colliders = []
+
+    for column, row in sorted(solid, key=lambda cell: (cell[1], cell[0])):
+        if (column, row) in merged:
+            continue
+
+        width = 1
+        while (column + width, row) in solid and (column + width, row) not in merged:
+            width += 1
+
+        height = 1
+        while all((x, row + height) in solid and (x, row + height) not in merged
+                  for x in range(column, column + width)):
+            height += 1
+
+        for x in range(column, column + width):
+            for y in range(row, row + height):
+                merged.add((x, y))
+        colliders.append(Collider(pygame.Rect(column * tile_size, row * tile_size,
+                                              width * tile_size, height * tile_size)))
+    return colliders
@@ -1,6 +1,14 @@
 """Contains constants like movement_speed for all sprites"""
 STARTING_SCREEN_SIZE = [700, 700]
-FPS = 80
+FPS = 80  # Ticks per second of the menus and cutscenes
+UPDATES_PER_SECOND = 80  # Updates per second while playing a level, however often the screen is drawn
+MAX_UPDATES_PER_FRAME = 5  # If the game falls further behind than this it slows down rather than trying to catch up
+MAX_FPS = 240  # The most times the screen is drawn per second while playing a level, 0 for no limit
+LEVEL_LOAD_SCREEN_TIME = 2000  # How long the level name is shown for before the level starts, in milliseconds
+MENU_WAIT_TIME = 100  # The longest time in milliseconds a menu sleeps for while waiting for something to happen
+ASSET_LOADER_THREADS = 4  # Threads decoding images and sounds in the background, see misc/assets.py
+TEXT_CACHE_SIZE = 64  # How many rendered pieces of text are kept for reuse, see misc/text_cache.py
+PREBUILD_TIME_PER_FRAME = 2  # Milliseconds spent each frame getting the next map ready, see misc/map_prebuilder.py
 
 BLOCK_SIZE_X = 16
 BLOCK_SIZE_Y = 16
@@ -10,3 +18,11 @@ SCALE_UP = 2
 P_WALKING_SPEED = 4
 P_RUNNING_SPEED = 6
 E_WALKING_SPEED = 1.5
+
+DIRTY_RECT_RENDERING = False  # Only redraws the parts of the screen that change, see misc/renderer.py
+TILE_CHUNK_SIZE = 512  # Width and height in pixels of each pre-drawn surface of static tiles
+UPDATE_MARGIN = 256  # Sprites further than this many pixels off the screen are paused until they are nearly on it
+ENTITY_GRID_CELL_SIZE = 128  # Width and height in pixels of each cell of the entities_grid
+BATCHED_ENEMIES = False  # Updates the walking enemies all together with NumPy (if installed), see misc/enemy_system.py
+
+PROFILER_TRACE_SECONDS = 10  # How many seconds of the profiler's timings are kept for saving as a trace
@@ -0,0 +1,25 @@
+"""Contains the cutscene class, which plays animations (like the player dying or going down a pipe) one step per update
+instead of in their own loops, so the window keeps responding while they play"""
+from misc.constants import UPDATES_PER_SECOND
+
+
+def wait(seconds: float):
+    """Use as 'yield from wait(seconds)' inside a cutscene to do nothing for that long"""
+    for _ in range(round(seconds * UPDATES_PER_SECOND)):
+        yield
+
+
+class Cutscene:
+    """Plays the steps of a cutscene, which is a generator that yields after each step. While it plays nothing else on
+    the map is updated, but events are still handled and the screen is still drawn every tick."""
+    def __init__(self, game, steps):
+        self.game = game
+        self.steps = steps
+
+    def update(self):
+        """Runs the next step, and ends the cutscene after the last one"""
+        try:
+            next(self.steps)
+        except StopIteration:
+            if self.game.cutscene is self:  # The last step may have started another cutscene (like exiting a pipe)
+                self.game.cutscene = None
@@ -0,0 +1,179 @@
+"""Contains the batched enemy system, which updates all the walking enemies together using NumPy arrays instead of each
+enemy running its own update. It does the same as 'Enemy.update' does for a walking enemy: walk, fall, turn around at
+walls, land on blocks and die when falling off the screen. Enemies that are dying still update themselves.
+
+Only what actually changes is handed back to each enemy: its rect every update, its image only when its animation moves
+on to another frame, and its place in the entities_grid only when it moves into another cell.
+
+Collisions are with the same blocks and Colliders as 'Game.get_hit_blocks' gives, and like 'Enemy.x_collide' and
+'Enemy.y_collide' an enemy is moved to the edge of the first one it hits, so it ends up in the same place.
+
+NumPy is optional: the system is only used if BATCHED_ENEMIES is True and NumPy is installed."""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from misc.constants import BLOCK_SIZE_X, SCALE_UP, E_WALKING_SPEED
+from sprites.animations import EntityState
+
+TILE_SIZE = BLOCK_SIZE_X * SCALE_UP
+GRAVITY = 5  # Same as 'Enemy.gravity'
+
+
+def is_available() -> bool:
+    return numpy is not None
+
+
+class EnemySystem:
+    """Stores every enemy on the map's position, size and walking direction in arrays, and steps the ones being
+    updated all at once against a grid of which block covers each tile. Blocks (and Colliders) always cover whole
+    tiles and enemies are never bigger than a tile, so each enemy can only ever be touching the blocks at its four
+    corners.
+
+    While an enemy is in the arrays its animation_loop is kept in them instead, and is only given back to the enemy
+    when the enemies are loaded again."""
+    def __init__(self, game):
+        self.game = game
+        self.enemies = []
+        self.indexes = {}  # enemy -> its index in the arrays
+        self.x = self.y = self.width = self.height = self.direction = None  # direction is 1 for right and -1 for left
+        self.animation_loop = None
+        self.animation_length = None  # How many frames the animation of the enemy's current state has
+        self.shown_frame = None  # Which frame of that animation the enemy's image is, or -1 if it needs setting
+
+        # The blocks_grid's blocks in the order they were added, which is the order 'Game.get_hit_blocks' gives them in.
+        # Each array has an extra item at the end for "no block".
+        self.block_left = self.block_right = self.block_top = None
+        self.owners = None  # owners[row, column] is the index of the first block covering that tile, or the number of
+        # blocks if there isn't one. The extra row and column on every side never have a block, and anything off the
+        # map is treated as being in them.
+        self.first_column = self.first_row = 0  # The tile column and row of owners[1, 1]
+        self.blocks_version = None  # How many blocks had been added to and were in the blocks_grid when owners was made
+
+    def load(self, enemies):
+        """Run when a map has been loaded, with all the enemies on it"""
+        if self.animation_loop is not None:
+            for enemy, animation_loop in zip(self.enemies, self.animation_loop.tolist()):
+                enemy.animation_loop = animation_loop
+
+        self.enemies = list(enemies)
+        self.indexes = {enemy: index for index, enemy in enumerate(self.enemies)}
+        self.x = numpy.array([enemy.rect.x for enemy in self.enemies], dtype=numpy.int64)
+        self.y = numpy.array([enemy.rect.y for enemy in self.enemies], dtype=numpy.int64)
+        self.width = numpy.array([enemy.rect.width for enemy in self.enemies], dtype=numpy.int64)
+        self.height = numpy.array([enemy.rect.height for enemy in self.enemies], dtype=numpy.int64)
+        self.direction = numpy.array([1 if enemy.enemy_state is EntityState.GROUNDED_RIGHT else -1
+                                      for enemy in self.enemies], dtype=numpy.int64)
+        self.animation_loop = numpy.array([enemy.animation_loop for enemy in self.enemies], dtype=numpy.float64)
+        self.animation_length = numpy.array([len(enemy.animations[enemy.enemy_state]) for enemy in self.enemies],
+                                            dtype=numpy.float64)
+        self.shown_frame = numpy.full(len(self.enemies), -1, dtype=numpy.intp)
+        self.blocks_version = None
+
+    def get_blocks_version(self):
+        blocks_grid = self.game.blocks_grid
+        return blocks_grid.sprites_added, len(blocks_grid)
+
+    def load_blocks(self):
+        """Makes the arrays of blocks and the grid of which block covers each tile from the blocks_grid. Only needed
+        again if a block has been added or has disappeared."""
+        blocks_grid = self.game.blocks_grid
+        blocks = sorted(blocks_grid, key=blocks_grid.order.__getitem__)
+        self.block_left = numpy.array([block.rect.left for block in blocks] + [0], dtype=numpy.int64)
+        self.block_right = numpy.array([block.rect.right for block in blocks] + [0], dtype=numpy.int64)
+        self.block_top = numpy.array([block.rect.top for block in blocks] + [0], dtype=numpy.int64)
+
+        self.first_column = min((block.rect.left for block in blocks), default=0) // TILE_SIZE
+        self.first_row = min((block.rect.top for block in blocks), default=0) // TILE_SIZE
+        columns = max((block.rect.right for block in blocks), default=0) // TILE_SIZE - self.first_column + 1
+        rows = max((block.rect.bottom for block in blocks), default=0) // TILE_SIZE - self.first_row + 1
+        self.owners = numpy.full((rows + 2, columns + 2), len(blocks), dtype=numpy.intp)
+        for index in reversed(range(len(blocks))):  # So the first block covering a tile ends up being the one kept
+            rect = blocks[index].rect
+            self.owners[rect.top // TILE_SIZE - self.first_row + 1:(rect.bottom - 1) // TILE_SIZE - self.first_row + 2,
+                        rect.left // TILE_SIZE - self.first_column + 1:
+                        (rect.right - 1) // TILE_SIZE - self.first_column + 2] = index
+        self.blocks_version = self.get_blocks_version()
+
+    def get_hit_block(self, x, y, width, height):
+        """Returns whether each enemy is touching a block, and the index of the first one it's touching (the one
+        'Game.get_hit_blocks' would give first)"""
+        rows, columns = self.owners.shape
+        top = numpy.clip(y // TILE_SIZE - self.first_row + 1, 0, rows - 1)
+        bottom = numpy.clip((y + height - 1) // TILE_SIZE - self.first_row + 1, 0, rows - 1)
+        left = numpy.clip(x // TILE_SIZE - self.first_column + 1, 0, columns - 1)
+        right = numpy.clip((x + width - 1) // TILE_SIZE - self.first_column + 1, 0, columns - 1)
+
+        first = numpy.minimum(numpy.minimum(self.owners[top, left], self.owners[top, right]),
+                              numpy.minimum(self.owners[bottom, left], self.owners[bottom, right]))
+        return first < len(self.block_left) - 1, first
+
+    def is_batched(self, sprite) -> bool:
+        """Whether the sprite is updated by the enemy system rather than by its own update"""
+        return sprite in self.indexes and sprite.enemy_state is not EntityState.DEATH
+
+    def update(self, enemies: list):
+        """Updates the enemies, which must all be batched"""
+        if self.get_blocks_version() != self.blocks_version:
+            self.load_blocks()
+
+        indexes = numpy.fromiter((self.indexes[enemy] for enemy in enemies), dtype=numpy.intp, count=len(enemies))
+        x, y = self.x[indexes], self.y[indexes]
+        width, height, direction = self.width[indexes], self.height[indexes], self.direction[indexes]
+
+        self.animate(enemies, indexes)
+        has_fallen = y + self.game.camera.y >= self.game.size[0]
+        for index in numpy.flatnonzero(has_fallen):
+            enemies[index].death()
+
+        # Walking, where the position is rounded the same way as a pygame Rect rounds it
+        new_x = x + direction * E_WALKING_SPEED
+        x = numpy.trunc(new_x + numpy.copysign(0.5, new_x)).astype(numpy.int64)
+        hit_wall, hit_block = self.get_hit_block(x, y, width, height)
+        x = numpy.where(hit_wall & (direction > 0), self.block_left[hit_block] - width, x)
+        x = numpy.where(hit_wall & (direction < 0), self.block_right[hit_block], x)
+        direction = numpy.where(hit_wall, -direction, direction)
+
+        # Falling
+        y = y + GRAVITY
+        hit_ground, hit_block = self.get_hit_block(x, y, width, height)
+        y = numpy.where(hit_ground, self.block_top[hit_block] - height, y)
+
+        old_cells = self.get_cell_ranges(self.x[indexes], self.y[indexes], width, height)
+        self.x[indexes], self.y[indexes], self.direction[indexes] = x, y, direction
+        for enemy, enemy_x, enemy_y in zip(enemies, x.tolist(), y.tolist()):
+            enemy.rect.topleft = (enemy_x, enemy_y)
+
+        for index in numpy.flatnonzero(hit_wall).tolist():
+            enemy = enemies[index]
+            enemy.enemy_state = EntityState.GROUNDED_RIGHT if direction[index] > 0 else EntityState.GROUNDED_LEFT
+            self.animation_length[indexes[index]] = len(enemy.animations[enemy.enemy_state])
+            self.shown_frame[indexes[index]] = -1
+
+        # Same as running 'entities_grid.move' for every enemy, but only the ones that have changed cells need it
+        entities_grid = self.game.entities_grid
+        moved = numpy.zeros(len(enemies), dtype=bool)
+        for old, new in zip(old_cells, self.get_cell_ranges(x, y, width, height)):
+            moved |= old != new
+        for index in numpy.flatnonzero(moved).tolist():
+            if enemies[index] in entities_grid.sprite_cells:
+                entities_grid.insert(enemies[index])
+
+    def animate(self, enemies: list, indexes):
+        """Same as 'Enemy.animate' for each enemy, which are all walking"""
+        animation_loop = self.animation_loop[indexes]
+        frame = animation_loop.astype(numpy.intp)  # Never negative, so this is the same as rounding down
+        changed = numpy.flatnonzero(frame != self.shown_frame[indexes])
+        for index, enemy_frame in zip(changed.tolist(), frame[changed].tolist()):
+            enemy = enemies[index]
+            enemy.image = enemy.animations[enemy.enemy_state][enemy_frame]
+        self.shown_frame[indexes] = frame
+
+        animation_loop = animation_loop + 0.1
+        self.animation_loop[indexes] = numpy.where(animation_loop >= self.animation_length[indexes], 0, animation_loop)
+
+    def get_cell_ranges(self, x, y, width, height) -> tuple:
+        """The first and last column and row of the entities_grid each enemy is in, like 'SpatialHash.get_cell_range'"""
+        cell_size = self.game.entities_grid.cell_size
+        return x // cell_size, (x + width - 1) // cell_size, y // cell_size, (y + height - 1) // cell_size
@@ -1,6 +1,8 @@
 """Game class to store all the variables, sprites, maps, as this allows me to run pygame update functions (like draw all
  sprites onto the screen) to all sprites every tick (which is required)"""
-from time import sleep
+import os
+from itertools import groupby
+from time import strftime, perf_counter
 
 import pygame
 
@@ -8,29 +10,63 @@ from misc.maps import MapId
 from misc.constants import *
 from misc.colours import Colour
 from misc.button import Button
-from sounds.sounds import play_music, play_sound, pause_music, MusicName, SoundName
+from misc.spatial_hash import SpatialHash
+from misc.camera import Camera
+from misc.tile_layer import StaticTileLayer
+from misc.renderer import Renderer, DirtyRectRenderer
+from misc.colliders import merge_tiles
+from misc import enemy_system
+from misc.profiler import Profiler
+from misc.cutscene import Cutscene
+from misc.objectives import Objectives
+from misc.map_prebuilder import MapPrebuilder
+from misc.assets import assets
+from misc.text_cache import render_text
+from misc.scenes import PlayScene, MenuScene, WaitScene
+from sounds.sounds import play_music, play_sound, pause_music, preload_music, update_music, MusicName, SoundName,\
+    sound_bank
 from sprites.sprite_sheets import load_overworld_spritesheets
-from sprites.all_sprites import Block, Underground, InvisibleWall, Player, Snake, Pipe, Ground, Key, Brick,\
-    Shroom, Bee, Rabbit, EnemyDisappearingBlock, GoalDisappearingBlock, Coin, RotationDirection, GoalLandingBlock,\
-    Overlay
+from sprites.all_sprites import Overlay
+from sprites.tile_registry import create_tiles
+from sprites.entity_pool import reset_pools
+
+RULES_IMAGE = "img/rules.png"
+CONTROLS_IMAGE = "img/controls.png"
+TEXT_SIZE = 32  # Font size of display_text
 
 
 class Game:
     """Contains the entire game and all variables and main pygame related functions like draw that continuously display
-    all sprites every tick"""
-    def __init__(self):
+    all sprites every tick. If headless is True there is no window or sound, the game runs as fast as it can and it
+    starts straight on start_map_id. input_source replaces the keyboard: it's called every tick and has to return
+    something like what pygame.key.get_pressed() does (see misc/scripted_input.py)."""
+    def __init__(self, headless: bool = False, start_map_id: MapId = None, input_source=None):
+        self.headless = headless
+        if headless:  # These have to be set before pygame starts
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        self.fps = 0 if headless else FPS  # 0 means the clock never waits
+        self.max_fps = 0 if headless else MAX_FPS
+        self.input_source = input_source
+        self.restart_on_death = False  # If True the player dying starts the same map again straight away, which the
+        # benchmark uses so that it keeps measuring the map it is on
+
         pygame.init()  # starts pygame module and allows all its functions to work.
         self.size = STARTING_SCREEN_SIZE
         self.screen = pygame.display.set_mode(STARTING_SCREEN_SIZE, pygame.RESIZABLE)
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font("courier.ttf", 32)
         pygame.display.set_caption("OCR NEA Dungeons Platformer Game")
-        self.spritesheets = load_overworld_spritesheets()
+        # Everything below starts decoding on the asset manager's threads, and is only waited for when it's first used
+        self.spritesheets = load_overworld_spritesheets()  # First, as they are needed soonest
+        sound_bank.preload()  # So that playing a sound effect never waits for the disk
+        preload_music(MusicName.TITLE_THEME)
+        preload_music(MapId.LEVEL_1_1.get_background_music())
 
         self.map_ids = [Id for Id in MapId]
         self.current_map_id = MapId.LEVEL_1_1
         self.background_colour = Colour.BLACK
 
+        reset_pools()  # The pools could still have instances from another Game
         self.all_sprites_group = pygame.sprite.LayeredUpdates()
         self.blocks_group = pygame.sprite.LayeredUpdates()
         self.pipes_group = pygame.sprite.LayeredUpdates()
@@ -40,54 +76,170 @@ class Game:
         self.keys_group = pygame.sprite.LayeredUpdates()
         self.goal_blocks_group = pygame.sprite.LayeredUpdates()
         self.overlay_group = pygame.sprite.LayeredUpdates()
+        self.hud_group = pygame.sprite.LayeredUpdates()  # Sprites drawn at a fixed place on the screen, not the map
+
+        self.camera = Camera()
+        self.tile_layers = {}  # MapId -> StaticTileLayer, so each map's static tiles are only ever drawn once
+        self.tile_layer = None  # The StaticTileLayer of the map being played
+        self.map_colliders = {}  # MapId -> Colliders made from the map's static tiles (see misc/colliders.py)
+        self.prebuilder = MapPrebuilder(self)  # Gets the next map ready while this one is played
+        self.renderer = DirtyRectRenderer(self) if DIRTY_RECT_RENDERING else Renderer(self)
+        self.profiler = Profiler()
+        self.update_time = 1 / UPDATES_PER_SECOND
+        self.update_time_left = 0  # Seconds of time passed that haven't been updated for yet
+        self.last_frame_time = perf_counter()
+        self.previous_positions = {}  # sprite -> where it was before the last update, so drawing can happen between
+        # updates
+
+        self.blocks_grid = SpatialHash(BLOCK_SIZE_X * SCALE_UP)  # Broad phase for collisions with the blocks_group's
+        # Colliders and the blocks that aren't merged into them
+        self.entities_grid = SpatialHash(ENTITY_GRID_CELL_SIZE)  # Sprites on the map which are drawn or updated, so
+        # only the ones near the screen need to be looked at
+        self.enemy_system = enemy_system.EnemySystem(self) if BATCHED_ENEMIES and enemy_system.is_available() else None
 
         self.running = True
         self.playing = False
+        self.scene = None  # What the game is doing, see misc/scenes.py
+        self.cutscene = None  # The Cutscene playing, if there is one
 
         self.num_lives = 7
+        self.objectives = Objectives()  # How many enemies, coins and keys are left on the map
         self.overlay = Overlay(self, 0, 0)
 
-        self.key_found = self.coins_collected = self.no_more_enemies = self.level_finished = False
+        self.level_finished = False
+        self.tile_load_times = {}  # Entity class name -> seconds it took to create them when the map was last loaded
 
-        self.title_screen()
+        if start_map_id is not None:
+            self.current_map_id = start_map_id
+            self.load_map()
+        else:
+            self.title_screen()
 
-    def events(self):
+    def events(self, wait_time: int = 0) -> list:
         """To always run no matter what to catch events like closing the program which are only specific to the game as
-        a whole"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.playing = self.running = False
-            elif event.type == pygame.VIDEORESIZE:  # Moves camera so everything is in the middle.
-                dx = self.screen.get_size()[0] - self.size[0]  # self.screen.get_size()[0] is the new width,
-                # self.size[0] is the old width
-                dy = self.screen.get_size()[1] - self.size[1]  # same here but with height
-
-                self.size = self.screen.get_size()  # sets the size variable equal to the current size.
-                self.move_sprites(dx / 2, dy / 2)
+        a whole. If there aren't any events, waits up to wait_time milliseconds for one (without using the CPU).
+        Returns the events so that they can also be used by whatever ran this."""
+        with self.profiler.section("events"):
+            events = pygame.event.get()
+            if not events and wait_time > 0:
+                events = [pygame.event.wait(wait_time)]  # Is pygame.NOEVENT if nothing happened in time
+
+            update_music()  # Starts any music that has finished loading in the background
+            for event in events:
+                self.handle_event(event)
+        return events
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.playing = self.running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle()
+            self.renderer.redraw_all()  # Clears away the overlay
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and self.profiler.enabled:
+            self.profiler.save_trace(f"trace_{self.current_map_id.name}_{strftime('%Y%m%d_%H%M%S')}.json")
+        elif event.type == pygame.VIDEORESIZE:  # Moves camera so everything is in the middle.
+            dx = self.screen.get_size()[0] - self.size[0]  # self.screen.get_size()[0] is the new width,
+            # self.size[0] is the old width
+            dy = self.screen.get_size()[1] - self.size[1]  # same here but with height
+
+            self.size = self.screen.get_size()  # sets the size variable equal to the current size.
+            self.camera.move(dx / 2, dy / 2)
 
     def update(self):
         """Runs all update functions for all sprites which updates them during the game.
+        Only used while 'self.playing = True'. Sprites too far off the screen are paused."""
+        with self.profiler.section("update"):
+            sprites = [sprite for sprite in self.get_sprites_in(self.camera.get_view_rect(self.size, UPDATE_MARGIN))
+                       if sprite.needs_update]
+            self.profiler.count("sprites updated", len(sprites))
+            self.profiler.count("sprites total", len(self.all_sprites_group))
+            self.camera.save_position()
+            self.previous_positions = {sprite: sprite.rect.topleft for sprite in sprites}
+            if self.cutscene is not None:  # Everything else is paused while a cutscene plays
+                with self.profiler.section("cutscene"):
+                    self.cutscene.update()
+                return
+
+            if self.enemy_system is None:
+                self.update_sprites(sprites)
+                return
+            # Each run of enemies next to each other is updated together, so everything still updates in the same
+            # order as if the enemies updated themselves
+            for batched, run in groupby(sprites, key=self.enemy_system.is_batched):
+                if batched:
+                    with self.profiler.section("enemy system"):
+                        self.enemy_system.update(list(run))
+                else:
+                    self.update_sprites(run)
+
+    def update_sprites(self, sprites):
+        for sprite in sprites:
+            with self.profiler.section(type(sprite).__name__):
+                sprite.update()
+            self.entities_grid.move(sprite)
+
+    def draw(self, interpolation: float = 1):
+        """Draws all the sprites onto the screen, part of the way (interpolation is from 0 to 1) between where they
+        were before the last update and where they are now. Waits so that there are no more than max_fps draws a
+        second.
         Only used while 'self.playing = True'."""
-        self.all_sprites_group.update()
-
-    def draw(self):
-        """Draws all the sprites onto the screen, which has to be done every tick.
-        Only used while 'self.playing = True'."""
-        self.screen.fill(self.background_colour)
-        self.all_sprites_group.draw(self.screen)
-        self.clock.tick(FPS)
-        pygame.display.update()
+        with self.profiler.section("draw"):
+            self.renderer.draw(interpolation)
+            if self.profiler.show_overlay:
+                self.renderer.add_dirty_rect(self.profiler.draw_overlay(self.screen))
+        self.clock.tick(self.max_fps)
+        with self.profiler.section("display flip"):
+            self.renderer.present()
+        self.profiler.count("pixels updated", self.renderer.pixels_updated)
+        assets.first_frame_shown()
 
     def game_functions(self):
         """Runs 'events', 'update' and 'draw' functions which need to be run every second to update the screen and catch
-        hold of events like closing the program which are only specific to the game as a whole"""
+        hold of events like closing the program which are only specific to the game as a whole.
+        Updates happen UPDATES_PER_SECOND times a second however fast the computer is, so there can be several updates
+        (or none) each time this is run. Headless games always update once, so they play out the same every time."""
+        self.profiler.start_frame()
         self.events()
-        self.update()
-        self.draw()
+
+        now = perf_counter()
+        self.update_time_left += self.update_time if self.headless else now - self.last_frame_time
+        self.last_frame_time = now
+
+        updates = 0
+        while self.playing and self.update_time_left >= self.update_time:
+            if updates == MAX_UPDATES_PER_FRAME:  # Too far behind, so the time is dropped and the game slows down
+                self.update_time_left = 0
+                break
+            self.update_time_left -= self.update_time
+            self.update()
+            updates += 1
+
+        if self.playing:
+            self.prebuilder.step(PREBUILD_TIME_PER_FRAME / 1000)
+            self.draw(1 if self.headless else self.update_time_left / self.update_time)
+
+    def change_scene(self, scene):
+        """Makes the main loop run the scene's tick function from now on"""
+        self.scene = scene
+        scene.start()
+
+    def play_cutscene(self, steps):
+        """Starts playing a cutscene from the next update, unless one is already playing. steps is a generator which
+        yields after each step (see misc/cutscene.py)."""
+        if self.cutscene is None:
+            self.cutscene = Cutscene(self, steps)
+
+    def reset_update_timer(self):
+        """Run after the game has been stopped (like by a cutscene or loading a map), so that the time spent isn't
+        caught up on"""
+        self.update_time_left = 0
+        self.last_frame_time = perf_counter()
+        self.previous_positions = {}
+        self.camera.save_position()
 
     # _________________________________________________SCREEN FUNCTIONS_________________________________________________
     def display_text(self, words, title_x = None, title_y = None, shifted_up = False, shifted_up_2 = False):
-        title = self.font.render(words, True, Colour.WHITE)
+        title = render_text(words, Colour.WHITE, TEXT_SIZE)
         if title_x is None:
             title_x = (self.size[0] - title.get_size()[0]) // 2
 
@@ -115,28 +267,16 @@ class Game:
 
         self.screen.blit(play_button.image, play_button.rect)
         self.screen.blit(rules_button.image, rules_button.rect)
-        self.clock.tick(FPS)
+        self.clock.tick(self.fps)
         pygame.display.update()
+        assets.first_frame_shown()
+        assets.preload_image(RULES_IMAGE)  # Ready in case the rules button is clicked
 
         self.pause_music()
         play_music(MusicName.TITLE_THEME)
         self.current_map_id = MapId.LEVEL_1_1
 
-        while self.running:
-            self.events()
-
-            # Both of these variables are needed to determine whether the button itself has been clicked.
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_is_pressed = pygame.mouse.get_pressed()  # Returns a list [l_click, r_click, m_click] and shows
-            # whether it has been clicked or not.
-
-            if play_button.is_pressed(mouse_pos, mouse_is_pressed):
-                self.load_map()
-                break  # ends intro_screen while loop
-
-            if rules_button.is_pressed(mouse_pos, mouse_is_pressed):
-                self.rules_screen()
-                break  # ends intro_screen while loop
+        self.change_scene(MenuScene(self, [(play_button, self.load_map), (rules_button, self.rules_screen)]))
 
     def game_over_screen(self):
         """Run when self.num_lives = 0"""
@@ -148,23 +288,13 @@ class Game:
                              bg_colour=Colour.BLACK, content="Play Again?", fontsize=32)
 
         self.screen.blit(play_button.image, play_button.rect)
-        self.clock.tick(FPS)
+        self.clock.tick(self.fps)
         pygame.display.update()
 
         self.play_sound(SoundName.GAME_OVER)
 
-        while self.running:
-            self.events()
-
-            # Both of these variables are needed to determine whether the button itself has been clicked.
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_is_pressed = pygame.mouse.get_pressed()  # Returns a list [l_click, r_click, m_click] and shows
-            # whether it has been clicked or not.
-
-            if play_button.is_pressed(mouse_pos, mouse_is_pressed):
-                sleep(1)
-                self.title_screen()
-                break  # ends intro_screen while loop
+        play_again = lambda: self.change_scene(WaitScene(self, 1000, self.title_screen))
+        self.change_scene(MenuScene(self, [(play_button, play_again)]))
 
     def victory_screen(self):
         """Run when the player beats the game"""
@@ -177,37 +307,26 @@ class Game:
                              bg_colour=Colour.BLACK, content="Play Again?", fontsize=32)
 
         self.screen.blit(play_button.image, play_button.rect)
-        self.clock.tick(FPS)
+        self.clock.tick(self.fps)
         pygame.display.update()
 
-        while self.running:
-            self.events()
-
-            # Both of these variables are needed to determine whether the button itself has been clicked.
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_is_pressed = pygame.mouse.get_pressed()  # Returns a list [l_click, r_click, m_click] and shows
-            # whether it has been clicked or not.
-
-            if play_button.is_pressed(mouse_pos, mouse_is_pressed):
-                self.title_screen()
-                break  # ends intro_screen while loop
+        self.change_scene(MenuScene(self, [(play_button, self.title_screen)]))
 
     def level_load_screen(self):
         pause_music()
 
         self.screen.fill(Colour.BLACK)
-        self.clock.tick(FPS)
+        self.clock.tick(self.fps)
 
         self.display_text(self.current_map_id.get_level_name(), shifted_up_2=True)
         self.overlay.during_level_loading_screen()
         self.overlay_group.draw(self.screen)
 
         pygame.display.update()
-        sleep(2)
+        assets.first_frame_shown()
 
     def rules_screen(self):
-        rules_image = pygame.image.load("img/rules.png")
-        rules_image = pygame.transform.scale(rules_image, self.size)
+        rules_image = pygame.transform.scale(assets.get_image(RULES_IMAGE), self.size)
         self.screen.blit(rules_image, (0,0))
 
         back_button = Button(x=20, y=20, width=100, height=50, fg_colour=Colour.WHITE,
@@ -217,53 +336,47 @@ class Game:
 
         self.screen.blit(back_button.image, back_button.rect)
         self.screen.blit(controls_button.image, controls_button.rect)
-        self.clock.tick(FPS)
+        self.clock.tick(self.fps)
         pygame.display.update()
 
-        while self.running:
-            self.events()
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_is_pressed = pygame.mouse.get_pressed()
-
-            if back_button.is_pressed(mouse_pos, mouse_is_pressed):
-                self.title_screen()
-                break  # ends intro_screen while loop
-
-            elif controls_button.is_pressed(mouse_pos, mouse_is_pressed):
-                self.controls_screen()
-                break  # ends intro_screen while loop
+        assets.preload_image(CONTROLS_IMAGE)
+        self.change_scene(MenuScene(self, [(back_button, self.title_screen), (controls_button, self.controls_screen)]))
 
     def controls_screen(self):
-        controls_image = pygame.image.load("img/controls.png")
-        controls_image = pygame.transform.scale(controls_image, self.size)
+        controls_image = pygame.transform.scale(assets.get_image(CONTROLS_IMAGE), self.size)
         self.screen.blit(controls_image, (0, 0))
 
         back_button = Button(x=300, y=600, width=100, height=50, fg_colour=Colour.WHITE,
                              bg_colour=Colour.TITLE_SCREEN, content="Back", fontsize=32)
 
         self.screen.blit(back_button.image, back_button.rect)
-        self.clock.tick(FPS)
+        self.clock.tick(self.fps)
         pygame.display.update()
 
-        while self.running:
-            self.events()
-            mouse_pos = pygame.mouse.get_pos()
-            mouse_is_pressed = pygame.mouse.get_pressed()
-
-            if back_button.is_pressed(mouse_pos, mouse_is_pressed):
-                self.rules_screen()
-                break  # ends intro_screen while loop
-
+        self.change_scene(MenuScene(self, [(back_button, self.rules_screen)]))
 
     # ________________________________________________LOAD MAP FUNCTIONS________________________________________________
     def load_map(self):
-        """Loads a map"""
+        """Loads a map, first showing the level's name for a while if it's the start of a new level"""
         if self.current_map_id.is_first_map():  # If new level loading as opposed to new map
+            preload_music(self.current_map_id.get_background_music())  # Loads in the background while the level's
+            # name is shown
             self.level_load_screen()
-            play_music(self.current_map_id.get_background_music())
-
+            self.prebuilder.start(self.current_map_id)  # Got ready while the level's name is shown
+            self.change_scene(WaitScene(self, 0 if self.headless else LEVEL_LOAD_SCREEN_TIME, self.start_level))
+        else:
+            self.start_map()
+
+    def start_level(self):
+        play_music(self.current_map_id.get_background_music())
+        preload_music(self.current_map_id.get_next_level_music())  # Ready for when this level is finished
+        self.start_map()
+
+    def start_map(self):
+        """Creates the current map and starts playing it"""
         self.background_colour = self.current_map_id.get_background_colour()
-        self.playing = True
+        self.change_scene(PlayScene(self))
+        self.cutscene = None
         self.empty_screen()
         self.create_map()
         self.centre_character()
@@ -271,85 +384,93 @@ class Game:
         player = [_ for _ in self.player_group][0]
         player.if_exit_pipe()
 
-        self.key_found = not self.is_group_on_screen(self.keys_group)  # True if there is no key, False if there is (as
-        # it needs to be found)
-        self.no_more_enemies = not self.is_group_on_screen(self.enemies_group)
-        self.coins_collected = not self.is_group_on_screen(self.coins_group)
-
         self.level_finished = False
 
         self.overlay.during_level()
+        if self.current_map_id is not MapId.get_maps_list()[-1]:
+            self.prebuilder.start(self.current_map_id.get_next_map())
+        self.reset_update_timer()
+        self.renderer.redraw_all()  # The screen has been drawn on by the menus or the level loading screen
 
     def empty_screen(self):
         """Empties screen of any sprites to get ready for next map loading"""
+        self.tile_layer = None  # So the tile layer isn't told about every tile being removed
         for entity in self.all_sprites_group:
             if entity not in self.overlay_group:
                 entity.remove_from_screen()
 
     def create_map(self):
-        """Creates the map from the blueprints given in the 'maps.py' file."""
-        for y, row, in enumerate(self.current_map_id.get_map()):
-            for x, item, in enumerate(row):
-                if item == "b":
-                    Block.create_instance(self, x, y)
-                if item == "B":
-                    Brick.create_instance(self, x, y)
-
-                elif item == "G":
-                    Ground.create_instance(self, x, y)
-                elif item == "U":
-                    Underground.create_instance(self, x, y)
-
-                elif item == "d":
-                    EnemyDisappearingBlock.create_instance(self, x, y)
-                elif item == "D":
-                    GoalDisappearingBlock.create_instance(self, x, y)
-                elif item == "g":
-                    GoalLandingBlock.create_instance(self, x, y)
-                elif item == "I":
-                    InvisibleWall.create_instance(self, x, y)
-                elif item == "P":
-                    Player.create_instance(self, x, y)
-                elif item == "q":
-                    Block.create_instance(self,x, y)
-
-                elif item == "K":
-                    Key.create_instance(self, x, y)
-                elif item == "C":
-                    Coin.create_instance(self, x, y)
-
-                elif item == "s":
-                    Snake.create_instance(self, x, y)
-                elif item == "S":
-                    Shroom.create_instance(self, x, y)
-                elif item == "z":
-                    Bee.create_instance(self, x, y)
-                elif item == "R":
-                    Rabbit.create_instance(self, x, y)
-
-                elif item == "v":  # facing up
-                    Pipe.create_instance(self, x, y, RotationDirection.UP)
-                elif item == "V":  # facing down
-                    Pipe.create_instance(self, x, y, RotationDirection.DOWN)
-                elif item == "h":  # facing left
-                    Pipe.create_instance(self, x, y, RotationDirection.LEFT)
-                elif item == "H":  # facing right
-                    Pipe.create_instance(self, x, y, RotationDirection.RIGHT)
+        """Creates the map from its blueprint in the 'maps' folder."""
+        self.blocks_grid.clear()
+        self.entities_grid.clear()
+        self.objectives.reset()
+        self.tile_load_times = create_tiles(self, self.prebuilder.take_map(self.current_map_id).get_items())
+
+        # Added in the order they are in the map, so the order sprites are drawn and updated in doesn't depend on the
+        # order their classes were created in
+        map_order = lambda sprite: (sprite.rect.y, sprite.rect.x)
+        blocks = [block for block in self.blocks_group if block in self.all_sprites_group]  # Unused blocks stay in
+        # the blocks_group, but can't be collided with
+        if self.current_map_id not in self.map_colliders:
+            self.map_colliders[self.current_map_id] = merge_tiles([block for block in blocks if self.is_merged(block)],
+                                                                  BLOCK_SIZE_X * SCALE_UP)
+        colliders = self.map_colliders[self.current_map_id] + [block for block in blocks if not self.is_merged(block)]
+        for collider in sorted(colliders, key=map_order):
+            self.blocks_grid.insert(collider)
+
+        for sprite in sorted(self.all_sprites_group, key=map_order):
+            if sprite not in self.hud_group and (sprite.needs_update or not sprite.is_static_tile):
+                self.entities_grid.insert(sprite)
+        if self.enemy_system is not None:
+            self.enemy_system.load(enemy for enemy in self.enemies_group if enemy in self.all_sprites_group)
+
+        self.load_tile_layer()
+        self.objectives.start()  # Only once the tile layer is ready, as it may remove disappearing blocks
+
+    @staticmethod
+    def is_merged(block) -> bool:
+        """Whether the block is collided with as part of a merged collider, which only blocks that never move or
+        disappear can be (not pipes or disappearing blocks)"""
+        return block.is_static_tile and not block.needs_update and not block.can_disappear
+
+    def load_tile_layer(self):
+        """Gets the map's static tiles ready to be drawn, only drawing them onto new surfaces the first time the map
+        is loaded"""
+        self.tile_layer = self.tile_layers.get(self.current_map_id)
+        if self.tile_layer is not None:
+            self.tile_layer.reset()
+            return
+
+        self.tile_layer = StaticTileLayer(TILE_CHUNK_SIZE)
+        for block in self.blocks_group:
+            if block.is_static_tile and block in self.all_sprites_group:
+                self.tile_layer.add_tile(block)
+        self.tile_layers[self.current_map_id] = self.tile_layer
 
     # __________________________________________________MISC. FUNCTIONS_________________________________________________
-    def is_group_on_screen(self, group):
-        """Sees if there are any members of group on the screen"""
-        all_members = [_ for _ in group]
-        for member in all_members:
-            if member in self.all_sprites_group:
-                return True
-        return False
-
-    def move_sprites(self, x, y):
-        for sprite in self.all_sprites_group:
-            if sprite not in self.overlay_group:
-                sprite.rect.x += x
-                sprite.rect.y += y
+    def get_pressed_keys(self):
+        """Returns which keys are being pressed, from the input source if there is one or else the keyboard"""
+        if self.input_source is not None:
+            return self.input_source()
+        return pygame.key.get_pressed()
+
+    def get_sprites_in(self, rect):
+        """Returns the sprites from the entities_grid near the rect on the map, in layer order"""
+        return sorted(self.entities_grid.query(rect), key=lambda sprite: sprite.layer)
+
+    def get_hit_blocks(self, sprite):
+        """Returns the blocks (or Colliders) the sprite is colliding with, only checking the ones in the grid cells
+        around it"""
+        with self.profiler.section("collision"):
+            nearby_blocks = self.blocks_grid.query(sprite.rect)
+            self.profiler.count("collision tests", len(nearby_blocks))
+            return [block for block in nearby_blocks if sprite.rect.colliderect(block.rect)]
+
+    def collide(self, sprite, group):
+        """Returns the sprites in the group that the sprite is colliding with"""
+        with self.profiler.section("collision"):
+            self.profiler.count("collision tests", len(group))
+            return pygame.sprite.spritecollide(sprite, group, False)
 
     def centre_character(self):
         """Run whenever a map is newly loaded to centre the character in the camera view"""
@@ -358,12 +479,7 @@ class Game:
         desired_x = self.size[0] // 2 - (player.rect.width / SCALE_UP)  # I only want to change x as I don't want
         # vertical camera movement, only lateral camera movement.
 
-        # Moves all sprites accordingly until player_group is in right place
-        while player.rect.x != desired_x:
-            if player.rect.x < desired_x:
-                self.move_sprites(1, 0)
-            else:
-                self.move_sprites(-1, 0)
+        self.camera.centre_on(player.rect, desired_x)
 
     # __________________________________________________MUSIC FUNCTIONS_________________________________________________
 
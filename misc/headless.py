@@ -0,0 +1,30 @@
+"""Runs the game without a window or sound, starting straight on a map and controlled by a script instead of the
+keyboard. Used for running the real game loop on machines without a screen, like for tests and profiling.
+
+Example: python -m misc.headless --map LEVEL_1_1 --ticks 600 --script "RIGHT*120 RIGHT+SPACE*1 -*60" """
+import argparse
+
+from misc.game import Game
+from misc.maps import MapId
+from misc.scripted_input import ScriptedInput
+
+
+def run_headless(map_id: MapId, ticks: int, input_source=None):
+    """Plays the map for the given number of ticks (or until the game stops playing) and returns the game"""
+    game = Game(headless=True, start_map_id=map_id, input_source=input_source)
+    for _ in range(ticks):
+        if not (game.running and game.playing):
+            break
+        game.scene.tick()
+    return game
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the game headless on a chosen map.")
+    parser.add_argument("--map", default=MapId.LEVEL_1_1.name, choices=[map_id.name for map_id in MapId])
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--script", default="RIGHT*40 RIGHT+SPACE*1", help="see ScriptedInput.from_string")
+    args = parser.parse_args()
+
+    finished_game = run_headless(MapId[args.map], args.ticks, ScriptedInput.from_string(args.script, loop=True))
+    print(f"Finished on {finished_game.current_map_id.name} with {finished_game.num_lives} lives left")
@@ -0,0 +1,136 @@
+"""Contains the compiled map format. Maps are written as text in 'maps/<MAP ID>.txt', one character per tile (see
+sprites/tile_registry.py for what each character is), and compiled into 'maps/<MAP ID>.bin' which is what the game
+loads.
+The maps should be compiled as a build step with: python -m misc.map_format
+A map that hasn't been compiled since its text file changed is compiled when it is loaded instead. If its .bin file
+can't be written (like when the game is installed somewhere read-only) the compiled map is only kept in memory.
+
+The compiled format (all numbers are little-endian):
+    header: b"MAP1", width (uint16), height (uint16), number of entities (uint16)
+    tiles: width * height bytes, row by row, each the tile's character or 0 if there isn't a tile there
+    entities: for each entity, its character (1 byte), x (uint16) and y (uint16), in the order they appear in the map
+Entities are the characters in ENTITY_CHARACTERS, everything else apart from EMPTY_CHARACTER is a tile."""
+import os
+import struct
+from heapq import merge
+
+MAPS_FOLDER = "maps"
+MAGIC = b"MAP1"
+HEADER = struct.Struct("<4sHHH")
+ENTITY = struct.Struct("<cHH")
+
+EMPTY_CHARACTER = "."
+ENTITY_CHARACTERS = "PKCsSzRvVhH"  # The player, keys, coins, enemies and pipes
+
+unsaved_maps = {}  # map name -> (modification time of its text file, compiled map) for maps whose .bin file couldn't be
+# written, so they are only compiled once
+
+
+class CompiledMap:
+    """A loaded map. tiles is a bytes-like object of width * height tile characters and entities is a list of
+    (character, x, y)."""
+    def __init__(self, width: int, height: int, tiles, entities: list):
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+        self.entities = entities
+
+    def get_tiles(self):
+        """Yields (x, y, character) for each tile, row by row"""
+        width = self.width
+        for index, tile in enumerate(self.tiles):
+            if tile:
+                yield index % width, index // width, chr(tile)
+
+    def get_items(self):
+        """Yields (x, y, character) for every tile and entity, in the order they are written in the map"""
+        return merge(self.get_tiles(), ((x, y, character) for character, x, y in self.entities),
+                     key=lambda item: (item[1], item[0]))
+
+
+def get_text_path(map_name: str) -> str:
+    return os.path.join(MAPS_FOLDER, map_name + ".txt")
+
+
+def get_compiled_path(map_name: str) -> str:
+    return os.path.join(MAPS_FOLDER, map_name + ".bin")
+
+
+def compile_rows(rows: list) -> bytes:
+    """Turns the rows of a map's text into the compiled format"""
+    width = max(len(row) for row in rows)
+    height = len(rows)
+    tiles = bytearray(width * height)
+    entities = []
+
+    for y, row in enumerate(rows):
+        for x, item in enumerate(row):
+            if item in ENTITY_CHARACTERS:
+                entities.append(ENTITY.pack(item.encode(), x, y))
+            elif item != EMPTY_CHARACTER:
+                tiles[y * width + x] = ord(item)
+
+    return HEADER.pack(MAGIC, width, height, len(entities)) + bytes(tiles) + b"".join(entities)
+
+
+def read(data: bytes) -> CompiledMap:
+    """Reads a compiled map"""
+    magic, width, height, num_entities = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a compiled map")
+
+    tiles_end = HEADER.size + width * height
+    tiles = memoryview(data)[HEADER.size:tiles_end]
+    entities = [(character.decode(), x, y) for character, x, y in
+                ENTITY.iter_unpack(data[tiles_end:tiles_end + num_entities * ENTITY.size])]
+    return CompiledMap(width, height, tiles, entities)
+
+
+def compile_text(map_name: str) -> bytes:
+    """Compiles the map's text file, returning the compiled map without saving it"""
+    with open(get_text_path(map_name)) as file:
+        return compile_rows(file.read().splitlines())
+
+
+def save_map(map_name: str, data: bytes):
+    with open(get_compiled_path(map_name), "wb") as file:
+        file.write(data)
+
+
+def compile_map(map_name: str) -> bytes:
+    """Compiles the map's text file into its .bin file, returning the compiled map"""
+    data = compile_text(map_name)
+    save_map(map_name, data)
+    return data
+
+
+def is_compiled(map_name: str) -> bool:
+    """Whether the map has been compiled since its text file was last changed"""
+    compiled_path = get_compiled_path(map_name)
+    return (os.path.exists(compiled_path) and
+            os.path.getmtime(compiled_path) >= os.path.getmtime(get_text_path(map_name)))
+
+
+def load_map(map_name: str) -> CompiledMap:
+    """Loads a map, compiling it first if needed"""
+    if not is_compiled(map_name):
+        text_time = os.path.getmtime(get_text_path(map_name))
+        if map_name in unsaved_maps and unsaved_maps[map_name][0] == text_time:
+            return read(unsaved_maps[map_name][1])
+
+        data = compile_text(map_name)
+        try:
+            save_map(map_name, data)
+        except OSError:
+            unsaved_maps[map_name] = (text_time, data)
+        return read(data)
+
+    with open(get_compiled_path(map_name), "rb") as file:
+        return read(file.read())
+
+
+if __name__ == "__main__":
+    for file_name in sorted(os.listdir(MAPS_FOLDER)):
+        if file_name.endswith(".txt"):
+            name = file_name[:-len(".txt")]
+            print(f"{name}: {len(compile_map(name))} bytes")
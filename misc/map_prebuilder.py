@@ -0,0 +1,112 @@
+"""Contains the map prebuilder, which gets the next map ready while the current one is being played so that going
+through a pipe or finishing a level doesn't have to wait for it. pygame can't draw or create sprites from another
+thread, so the work is split into small steps and a few milliseconds of them are run every frame instead.
+
+Getting a map ready means:
+    loading its compiled blueprint
+    creating enough unused instances of each entity class for it in their pools, so creating the map only reuses them
+    drawing its static tiles onto the chunks of its StaticTileLayer and merging them into colliders
+The map's entities are still put on the screen when it is started, which only takes moving the pooled instances."""
+from collections import Counter
+from time import perf_counter
+
+from misc.constants import TILE_CHUNK_SIZE, BLOCK_SIZE_X, BLOCK_SIZE_Y, SCALE_UP
+from misc.colliders import Collider, merge_tiles
+from misc.tile_layer import StaticTileLayer
+from sprites.tile_registry import tile_types
+
+STEP_SIZE = 16  # How many entities are created, or tiles looked at, in each step
+
+
+class MapPrebuilder:
+    """Gets one map ready at a time, a few steps every frame"""
+    def __init__(self, game):
+        self.game = game
+        self.map_id = None  # The map being got ready
+        self.compiled_map = None
+        self.steps = None  # Generator which does the next step each time it's run, None once the map is ready
+
+    def start(self, map_id):
+        """Starts getting the map ready, unless it already is (or is being)"""
+        if map_id == self.map_id:
+            return
+        self.map_id = map_id
+        self.compiled_map = None
+        self.steps = self.prebuild()
+
+    def step(self, seconds: float) -> bool:
+        """Does steps for up to seconds. Returns whether there is still more to do."""
+        if self.steps is None:
+            return False
+
+        end_time = perf_counter() + seconds
+        with self.game.profiler.section("prebuild"):
+            while perf_counter() < end_time:
+                if next(self.steps, None) is None:
+                    self.steps = None
+                    return False
+        return True
+
+    def take_map(self, map_id):
+        """Returns the map's compiled blueprint, loading it now if it hasn't been already. Its pooled instances are
+        about to be used up, so the map will need getting ready again next time."""
+        if map_id == self.map_id and self.compiled_map is not None:
+            compiled_map = self.compiled_map
+        else:
+            compiled_map = map_id.get_map()
+        if map_id == self.map_id:
+            self.map_id = self.compiled_map = self.steps = None
+        return compiled_map
+
+    def prebuild(self):
+        """Yields after each step"""
+        self.compiled_map = self.map_id.get_map()
+        items = [(x, y, tile_types[character]) for x, y, character in self.compiled_map.get_items()
+                 if character in tile_types]
+        yield True
+
+        yield from self.fill_pools(items)
+        if self.map_id not in self.game.tile_layers:
+            yield from self.build_tile_layer(items)
+
+    def fill_pools(self, items: list):
+        """Creates the unused instances the map will need, counting the ones on the screen now as they will be unused
+        by the time it is created"""
+        needed = Counter()
+        args = {}
+        for x, y, (entity_class, entity_args) in items:
+            needed[entity_class] += 1
+            args.setdefault(entity_class, entity_args)
+        on_screen = Counter(type(sprite) for sprite in self.game.all_sprites_group)
+
+        for entity_class, count in needed.items():
+            size = count - on_screen[entity_class]
+            while len(entity_class.pool.unused_instances) < size:
+                entity_class.prewarm_pool(self.game, min(size, len(entity_class.pool.unused_instances) + STEP_SIZE),
+                                          *args[entity_class])
+                yield True
+
+    def build_tile_layer(self, items: list):
+        """Draws the map's static tiles onto a new StaticTileLayer and merges them into colliders, the same as
+        'Game.load_tile_layer' and 'Game.create_map' would"""
+        tile_layer = StaticTileLayer(TILE_CHUNK_SIZE)
+        merged_tiles = []
+        for index in range(0, len(items), STEP_SIZE):
+            for x, y, (entity_class, entity_args) in items[index:index + STEP_SIZE]:
+                if not entity_class.is_static_tile:
+                    continue
+                image = entity_class.get_tile_image(self.game)
+                tile = Collider(image.get_rect(topleft=(x * BLOCK_SIZE_X * SCALE_UP, y * BLOCK_SIZE_Y * SCALE_UP)))
+                tile_layer.add_image(tile.rect.topleft, image)
+                if self.game.is_merged(entity_class):
+                    merged_tiles.append(tile)
+            yield True
+
+        for chunk in list(tile_layer.dirty_chunks):
+            tile_layer.bake_chunk(chunk)
+            yield True
+
+        if self.map_id not in self.game.map_colliders:
+            self.game.map_colliders[self.map_id] = merge_tiles(merged_tiles, BLOCK_SIZE_X * SCALE_UP)
+        self.game.tile_layers[self.map_id] = tile_layer
+        yield True
@@ -1,4 +1,5 @@
 from enum import Enum, auto
+from misc import map_format
 from misc.colours import Colour
 from sounds.sounds import MusicName
 
@@ -37,9 +38,9 @@ class MapId(Enum):
     LEVEL_3_2 = auto()
     LEVEL_4_1 = auto()
 
-    def get_map(self):
-        """Returns the blueprint of the map the id is referring to"""
-        return maps[self]
+    def get_map(self) -> map_format.CompiledMap:
+        """Loads the blueprint of the map the id is referring to (from 'maps/<MAP ID>.bin', see misc/map_format.py)"""
+        return map_format.load_map(self.name)
 
     @classmethod
     def get_maps_list(cls):
@@ -68,6 +69,14 @@ class MapId(Enum):
     def get_background_music(self):
         return background_music[self.get_first_level_map()]
 
+    def get_next_level_music(self):
+        """Returns the background music of the level after this one, or None if this is the last level"""
+        maps_list = self.get_maps_list()
+        for map_id in maps_list[binary_search_enums(maps_list, self) + 1:]:
+            if map_id.is_first_map():
+                return map_id.get_background_music()
+        return None
+
 
 first_map_of_levels = {MapId.LEVEL_1_1: MapId.LEVEL_1_1,
                        MapId.LEVEL_1_2: MapId.LEVEL_1_1,
@@ -92,306 +101,3 @@ background_music = {MapId.LEVEL_1_1: MusicName.FOR_ME,
                     MapId.LEVEL_2_1: MusicName.WAVES_IN_FLIGHT,
                     MapId.LEVEL_3_1: MusicName.THE_WAY_YOU_LOVE,
                     MapId.LEVEL_4_1: MusicName.FIELDS_OF_ICE}
-
-maps = {MapId.LEVEL_1_1: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I.....................B..................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I........................................BBBBBBBBBBB",
-                          ".........I.......P...........B.B.B......K.........BBBBBBBBBBB",
-                          ".........I.......#.............................h###BBBBBBBBBB",
-                          ".........I..........................s..........####BBBBBBBBBB",
-                          "GGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGG",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU"],
-        MapId.LEVEL_1_2: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBV#BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBP#BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB##BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB...............BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB...............BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB........K......BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB...............h###BBBBBBBBB",
-                          "BBBBBBBBBBBBBB........s.S....####BBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_1_3: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBV#BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB##BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBP#BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB##BBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBCC.......z.....BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB.......ddd.....BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB.......dKd.....BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB.......ddd.....h###BBBBBBBBB",
-                          "BBBBBBBBBBBBBB..........S..S.####BBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_1_4: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBBC.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.BBBBBBBBBBB",
-                          "BBBBBBBBBBC.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.C.D..........",
-                          "BBBBBBH##PC.C.C.C.C.C.C.C.C.C.C.C.C.C.CRCRC.CRC.C.D..........",
-                          "BBBBBB####C.C.C.C.C.CzCzCzC.C.C.C.C.C.C.C.C.C.C.C.D..........",
-                          "GGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGgggggggggggg",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU"],
-
-        MapId.LEVEL_2_1: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          ".........I...............BBBBBBBBBBBBBBBBB",
-                          ".........I...............BBBBBBBBBBBBBBBBB",
-                          ".........I..P.....K......BBBBBBBBBBBBBBBBB",
-                          ".........I..#............h###BBBBBBBBBBBBB",
-                          ".........I..........s....####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_2_2: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB..............KBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB...............BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB.............b.BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBH##P..............dh###BBBBBBBBBBBBB",
-                          "BBBBBBB####........S.....d####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_2_3: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB..............KBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB...............BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB..........b..R.BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB..........bbbddBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBH##P.........b.....h###BBBBBBBBBBBBB",
-                          "BBBBBBB####........R......####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_2_4: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB.................Rd..KBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB.................d....BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB................d.....BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB...............d......BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBH##P..............d..CCCCDh###BBBBBBBBBBBBB",
-                          "BBBBBBB####.......z.z.rzd...CCCCD####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_2_5: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB.................CCCCCBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBCCCCCCCCCCCCCCCCCCCCCCBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBCCCCCCCCCCCCCCCCCCCCCCBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB......................BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBH##PK....................Dh###BBBBBBBBBBBBB",
-                          "BBBBBBB####..........R......R..RD####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBB...BBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBB...BBBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBB....BBBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBssSSBBBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBB..........h###BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBB..........####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_2_6: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBCCCCC.................BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBCCCCC.................BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBbbbbb....bbb..........BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBB........bK..b.........BBBBBBBBBBBBBBBBB",
-                          "BBBBBBBH##P.......b....d.........D................",
-                          "BBBBBBB####......b.....d.s.R.z...D................",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBggggggggggggggggg",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB"],
-
-        MapId.LEVEL_3_1: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          ".........ICCCCCCCCCCCCCCCBBBBBBBBBBBBBBBBB",
-                          ".........ICCCCCCCCCCCCCCCBBBBBBBBBBBBBBBBB",
-                          ".........ICCPCCCCCCCCCCCKBBBBBBBBBBBBBBBBB",
-                          ".........ICC#CCCCCCCCCCCDh###BBBBBBBBBBBBB",
-                          ".........ICCCCCCCCCCCCCCD####BBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBB..BBBBBBBBBBBBBBBBBBBBBB"],
-        MapId.LEVEL_3_2: ["BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-                          "BBBBBBBBBB........................................BBBBBBBBBBB",
-                          "BBBBBBBBBBC.......................................BBBBBBBBBBB",
-                          "BBBBBBBBBBCC...............CIIIIIIIIICCIIIRCIIICCIBBBBBBBBBBB",
-                          "BBBBBBBBBBCCC...........IIIII.......IIII.IIII.I..IBBBBBBBBBBB",
-                          "BBBBBBBBBBCCCC..........I........................IBBBBBBBBBBB",
-                          "BBBBBBBBBBCCCCC........I......................S...BBBBBBBBBBB",
-                          "BBBBBBBBBBIIIIIIII....I.....II..IIIIIIIIIIIIIIIIIIBBBBBBBBBBB",
-                          "BBBBBBBBBB...........I.......III.........CCCCCCC..BBBBBBBBBBB",
-                          "BBBBBBBBBB..........IIII..IIII...........CCCCCCC..BBBBBBBBBBB",
-                          "BBBBBBBBBB.........II........I...........IIIIIII.............",
-                          "BBBBBBH##P........ICC...................I....................",
-                          "BBBBBB####........ICC.s...I.......s....I.....................",
-                          "GGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGgggggggggggg",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-                          "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU"],
-
-        MapId.LEVEL_4_1: [
-            "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-            "BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB",
-            "BBBBBBBBBB........sRs..S...z.z.............................ssssszzzzddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB........IIIIIIIIIIII.............................IIIIIIIIIddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB..........................................................ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB..........................................................ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB.................................................IIIIIII..ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB.....IIII..............s.s..........................z.....ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBBRRR....................III.............R..........II......ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBBIII....................................I.R................ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB.......................................IIII...............ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB..........................................................ddddddd...............BBBBBBBBBBB",
-            "BBBBBBBBBB..........................................................dCCCCCdCCCCCCCCCCCCCCCBBBBBBBBBBB",
-            "BBBBBBBBBB..........................................................dCCCCCdCCCCCCCCCCCCCCCBBBBBBBBBBB",
-            "BBBBBBBBBB..........................................................dCCKCCdCCCCCCCCCCCCCCCD..........",
-            "BBBBBBH##P..........................................................dCCCCCdCCCCCCCCCCCCCCCD..........",
-            "BBBBBB####..........................................................dCCCCCdCCCCCCCCCCCCCCCD..........",
-            "GGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGGggggggggggg",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU",
-            "UUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUUU"]}
@@ -0,0 +1,61 @@
+"""Contains the objectives of a level (killing all the enemies, collecting all the coins and finding the key). Instead of
+looking through the sprite groups to see what is left, the number of each thing left on the map is counted as they are
+created and removed, and anything waiting for objectives (like the disappearing blocks) is told once when they are
+all complete."""
+from enum import Enum, auto
+
+
+class Objective(Enum):
+    ENEMIES = auto()
+    COINS = auto()
+    KEYS = auto()
+
+
+class Objectives:
+    """Counts how many of each objective's sprites are left on the current map"""
+    def __init__(self):
+        self.remaining = {objective: 0 for objective in Objective}
+        self.listeners = []  # [(objectives, callback), ...] waiting for all of the objectives to be complete
+        self.started = False
+
+    def reset(self):
+        """Run before a map is created. Nothing is told about completed objectives until 'start' has been run, as the
+        map's sprites are still being created."""
+        for objective in self.remaining:
+            self.remaining[objective] = 0
+        self.listeners.clear()
+        self.started = False
+
+    def start(self):
+        """Run once the map has been created, telling anything waiting for objectives that the map doesn't have"""
+        self.started = True
+        self.notify()
+
+    def add(self, objective: Objective):
+        """Run when a sprite that has to be collected or killed is put on the map"""
+        self.remaining[objective] += 1
+
+    def complete(self, objective: Objective):
+        """Run when one of the objective's sprites has been collected or killed"""
+        self.remaining[objective] -= 1
+        if self.remaining[objective] == 0 and self.started:
+            self.notify()
+
+    def is_complete(self, objective: Objective) -> bool:
+        return self.remaining[objective] <= 0
+
+    def when_complete(self, objectives: tuple, callback):
+        """Runs callback once all the objectives are complete"""
+        self.listeners.append((objectives, callback))
+        if self.started:
+            self.notify()
+
+    def notify(self):
+        """Runs (and forgets) the callbacks whose objectives are all complete"""
+        waiting = []
+        for objectives, callback in self.listeners:
+            if all(self.is_complete(objective) for objective in objectives):
+                callback()
+            else:
+                waiting.append((objectives, callback))
+        self.listeners = waiting
@@ -0,0 +1,119 @@
+"""Contains the profiler, which times how long each part of a tick takes (like updating, collisions and drawing). In
+game, F3 turns it on and shows the overlay and F4 saves the last few seconds as a trace that can be opened in Chrome's
+'chrome://tracing' or https://ui.perfetto.dev"""
+import json
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+
+import pygame
+
+from misc.colours import Colour
+from misc.constants import PROFILER_TRACE_SECONDS
+from misc.text_cache import get_font
+
+
+class Profiler:
+    """Adds up the time spent in each named section during the current tick, and counts things like collision tests.
+    Does nothing unless enabled, so it can be left in the game loop."""
+    def __init__(self, trace_seconds: float = PROFILER_TRACE_SECONDS):
+        self.enabled = False
+        self.show_overlay = False
+        self.section_times = {}  # name -> seconds spent in that section this tick
+        self.counts = {}  # name -> how many times it happened this tick
+
+        # The last finished tick, which is what the overlay shows
+        self.frame_time = 0
+        self.last_section_times = {}
+        self.last_counts = {}
+
+        self.start_time = self.frame_start = perf_counter()
+        self.trace_seconds = trace_seconds
+        self.trace_events = deque()  # (name, start, duration) of each section, oldest first, plus
+        # ("counts", start, counts) at the end of each tick
+        self.font = None
+
+    def start_frame(self):
+        """Run at the start of every tick"""
+        now = perf_counter()
+        if self.enabled:
+            self.frame_time = now - self.frame_start
+            self.last_section_times = self.section_times
+            self.last_counts = self.counts
+            self.trace_events.append(("counts", now, self.counts))
+
+            oldest = now - self.trace_seconds
+            while self.trace_events and self.trace_events[0][1] < oldest:
+                self.trace_events.popleft()
+
+        self.frame_start = now
+        self.section_times = {}
+        self.counts = {}
+
+    @contextmanager
+    def section(self, name: str):
+        """Times everything run inside 'with profiler.section(name):'"""
+        if not self.enabled:
+            yield
+            return
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            self.section_times[name] = self.section_times.get(name, 0) + duration
+            self.trace_events.append((name, start, duration))
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            self.counts[name] = self.counts.get(name, 0) + amount
+
+    def toggle(self):
+        """Turns the profiler and its overlay on or off"""
+        self.enabled = self.show_overlay = not self.enabled
+        self.trace_events.clear()
+        self.frame_start = perf_counter()
+
+    def save_trace(self, file_name: str):
+        """Saves the last trace_seconds of sections and counts in Chrome's trace event format"""
+        to_microseconds = lambda seconds: round((seconds - self.start_time) * 1_000_000, 1)
+
+        events = []
+        for name, start, value in self.trace_events:
+            if name == "counts":
+                events.append({"name": "counts", "ph": "C", "ts": to_microseconds(start), "pid": 0, "tid": 0,
+                               "args": value})
+            else:
+                events.append({"name": name, "ph": "X", "ts": to_microseconds(start),
+                               "dur": round(value * 1_000_000, 1), "pid": 0, "tid": 0})
+
+        with open(file_name, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    def draw_overlay(self, screen) -> pygame.Rect:
+        """Draws the last tick's timings in the top right corner of the screen and returns where it was drawn"""
+        if self.font is None:
+            self.font = get_font(16)  # The lines change every tick, so they aren't put in the text cache
+
+        in_ms = lambda name: f"{self.last_section_times.get(name, 0) * 1000:.2f}ms"
+        lines = [f"frame  {self.frame_time * 1000:.2f}ms",
+                 f"events {in_ms('events')}",
+                 f"update {in_ms('update')}",
+                 f"draw   {in_ms('draw')}",
+                 f"flip   {in_ms('display flip')}",
+                 f"sprites updated  {self.last_counts.get('sprites updated', 0)}",
+                 f"sprites total    {self.last_counts.get('sprites total', 0)}",
+                 f"collision tests  {self.last_counts.get('collision tests', 0)}",
+                 f"pixels updated   {self.last_counts.get('pixels updated', 0)}"]
+
+        line_height = self.font.get_linesize()
+        images = [self.font.render(line, True, Colour.WHITE) for line in lines]
+        overlay_rect = pygame.Rect(0, 0, max(image.get_width() for image in images) + 10,
+                                   line_height * len(images) + 10)
+        overlay_rect.topright = (screen.get_width(), 0)
+
+        screen.fill(Colour.BLACK, overlay_rect)
+        for i, image in enumerate(images):
+            screen.blit(image, (overlay_rect.x + 5, overlay_rect.y + 5 + i * line_height))
+        return overlay_rect
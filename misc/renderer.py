@@ -0,0 +1,159 @@
+"""Contains the renderers, which draw the map and its sprites onto the screen during the game"""
+import pygame
+
+
+def merge_rects(rects):
+    """Joins together any rects that overlap, so that no part of the screen is drawn twice"""
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class Renderer:
+    """Draws the whole screen every tick"""
+    def __init__(self, game):
+        self.game = game
+        self.pixels_updated = 0  # How many pixels were sent to the display last tick
+
+        # Drawing can happen part of the way between two updates, so these are set at the start of every draw
+        self.interpolation = 1  # 0 is where everything was before the last update, 1 is where it is now
+        self.camera = game.camera
+        self.camera_offset = (0, 0)
+
+    def start_drawing(self, interpolation: float):
+        self.interpolation = interpolation
+        self.camera = self.game.camera.get_interpolated(interpolation)
+        self.camera_offset = self.game.camera.get_interpolated_offset(interpolation)
+
+    def get_screen_rect(self, sprite):
+        """Returns where the sprite is on the screen, part of the way between where it was before the last update and
+        where it is now"""
+        if sprite in self.game.hud_group:
+            return sprite.rect
+
+        previous_position = self.game.previous_positions.get(sprite)
+        if previous_position is None or self.interpolation == 1:
+            return self.camera.apply(sprite.rect)
+
+        x = previous_position[0] + (sprite.rect.x - previous_position[0]) * self.interpolation + self.camera_offset[0]
+        y = previous_position[1] + (sprite.rect.y - previous_position[1]) * self.interpolation + self.camera_offset[1]
+        return pygame.Rect(round(x), round(y), sprite.rect.width, sprite.rect.height)
+
+    def get_sprites_to_draw(self):
+        """Returns the sprites on the screen in layer order, so the same sprites end up on top. Static tiles are left
+        out as they are drawn by the tile layer."""
+        game = self.game
+        sprites = [sprite for sprite in game.get_sprites_in(game.camera.get_view_rect(game.size))
+                   if not sprite.is_static_tile]
+
+        for player in game.player_group:  # The player is moved during animations without the grid being told
+            if player not in sprites and player in game.all_sprites_group:
+                sprites.append(player)
+        return sprites + game.hud_group.sprites()
+
+    def draw_area(self, sprites, area=None):
+        """Draws the background, the static tiles and the sprites. If an area is given then only that part of the
+        screen is drawn."""
+        screen = self.game.screen
+        screen.set_clip(area)
+        screen.fill(self.game.background_colour)
+        if self.game.tile_layer is not None:
+            self.game.tile_layer.draw(screen, self.camera)
+
+        for sprite, screen_rect in sprites:
+            if area is None or area.colliderect(screen_rect):
+                screen.blit(sprite.image, screen_rect)
+        screen.set_clip(None)
+
+    def draw(self, interpolation: float = 1):
+        self.start_drawing(interpolation)
+        self.draw_area([(sprite, self.get_screen_rect(sprite)) for sprite in self.get_sprites_to_draw()])
+
+    def present(self):
+        """Sends what has been drawn to the display"""
+        pygame.display.update()
+        self.pixels_updated = self.game.size[0] * self.game.size[1]
+
+    def redraw_all(self):
+        """Run when something else has drawn onto the screen (like a menu) or a new map has been loaded"""
+        pass
+
+    def add_dirty_rect(self, rect):
+        """Run when something else has been drawn on top of this tick's drawing (like the profiler overlay), so that
+        part of the screen is updated too"""
+        pass
+
+
+class DirtyRectRenderer(Renderer):
+    """Only draws and updates the parts of the screen that have changed since the last tick. Everything has to be
+    drawn again when the camera moves, but on screens where hardly anything moves (like during the death animation)
+    this is a lot less work."""
+    def __init__(self, game):
+        super().__init__(game)
+        self.drawn = {}  # sprite -> (screen rect, image) it was last drawn with
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.last_camera_pos = self.last_size = self.last_tile_layer = self.last_background_colour = None
+
+    def redraw_all(self):
+        self.full_redraw = True
+
+    def add_dirty_rect(self, rect):
+        self.dirty_rects.append(rect)
+
+    def needs_full_redraw(self) -> bool:
+        game = self.game
+        return (self.full_redraw or self.last_camera_pos != (self.camera.x, self.camera.y)
+                or self.last_size != tuple(game.size) or self.last_tile_layer is not game.tile_layer
+                or self.last_background_colour != game.background_colour)
+
+    def get_dirty_rects(self, sprites):
+        """Returns the old and new position of every sprite that has moved, changed image, appeared or disappeared"""
+        dirty_rects = []
+        for sprite, screen_rect in sprites:
+            last_drawn = self.drawn.pop(sprite, None)
+            if last_drawn is None:
+                dirty_rects.append(screen_rect)
+            elif last_drawn[0] != screen_rect or last_drawn[1] is not sprite.image:
+                dirty_rects.append(last_drawn[0])
+                dirty_rects.append(screen_rect)
+
+        dirty_rects.extend(last_drawn[0] for last_drawn in self.drawn.values())  # Sprites no longer being drawn
+
+        if self.game.tile_layer is not None:  # Tiles that have been removed (like disappearing blocks)
+            dirty_rects.extend(self.camera.apply(rect) for rect in self.game.tile_layer.changed_tiles)
+        return dirty_rects
+
+    def draw(self, interpolation: float = 1):
+        self.start_drawing(interpolation)
+        game = self.game
+        sprites = [(sprite, self.get_screen_rect(sprite)) for sprite in self.get_sprites_to_draw()]
+
+        if self.needs_full_redraw():
+            self.draw_area(sprites)
+            self.dirty_rects = [game.screen.get_rect()]
+        else:
+            screen_rect = game.screen.get_rect()
+            self.dirty_rects = merge_rects([rect.clip(screen_rect) for rect in self.get_dirty_rects(sprites)
+                                            if rect.colliderect(screen_rect)])
+            for rect in self.dirty_rects:
+                self.draw_area(sprites, rect)
+
+        if game.tile_layer is not None:
+            game.tile_layer.changed_tiles.clear()
+        self.drawn = {sprite: (screen_rect, sprite.image) for sprite, screen_rect in sprites}
+        self.full_redraw = False
+        self.last_camera_pos = (self.camera.x, self.camera.y)
+        self.last_size = tuple(game.size)
+        self.last_tile_layer = game.tile_layer
+        self.last_background_colour = game.background_colour
+
+    def present(self):
+        pygame.display.update(self.dirty_rects)
+        self.pixels_updated = sum(rect.width * rect.height for rect in self.dirty_rects)
@@ -0,0 +1,83 @@
+"""Contains the scenes, which are what the game is doing at the moment (like showing a menu or playing a map). The main
+loop runs the current scene's tick function every tick. Going to another screen changes the scene instead of starting
+a new loop inside the old one, so however long the game is played for, old screens are never left running underneath."""
+import pygame
+
+from misc.colours import Colour
+from misc.constants import MENU_WAIT_TIME, PREBUILD_TIME_PER_FRAME
+
+
+class Scene:
+    """Base class of all scenes"""
+    def __init__(self, game):
+        self.game = game
+
+    def start(self):
+        """Run when the game changes to this scene"""
+        pass
+
+    def tick(self):
+        """Run every tick while this is the game's scene"""
+        pass
+
+
+class PlayScene(Scene):
+    """Playing the current map"""
+    def start(self):
+        self.game.playing = True
+
+    def tick(self):
+        self.game.game_functions()
+
+
+class MenuScene(Scene):
+    """A screen which has already been drawn, waiting for one of its buttons to be clicked. buttons is a list of
+    (Button, function run when it's clicked). The game sleeps until something happens, so an open menu uses almost no
+    CPU, and the screen is only drawn again if the window changes."""
+    def __init__(self, game, buttons: list):
+        super().__init__(game)
+        self.buttons = buttons
+        self.image = None  # What the screen looks like, for when it has to be drawn again
+
+    def start(self):
+        self.game.playing = False
+        self.image = self.game.screen.copy()
+
+    def tick(self):
+        for event in self.game.events(MENU_WAIT_TIME):
+            if event.type in [pygame.VIDEORESIZE, pygame.WINDOWEXPOSED]:
+                self.redraw()
+
+            for button, on_click in self.buttons:
+                if button.is_clicked(event):
+                    on_click()
+                    return
+
+    def redraw(self):
+        self.game.screen.fill(Colour.BLACK)
+        self.game.screen.blit(self.image, (0, 0))
+        pygame.display.update()
+
+
+class WaitScene(Scene):
+    """Leaves what's on the screen for wait_time milliseconds without freezing the window, then runs then_run (which
+    should change the scene). The time is also used to get the map being loaded ready."""
+    def __init__(self, game, wait_time: int, then_run):
+        super().__init__(game)
+        self.wait_time = wait_time
+        self.then_run = then_run
+        self.end_time = 0
+
+    def start(self):
+        self.game.playing = False
+        self.end_time = pygame.time.get_ticks() + self.wait_time
+        if self.wait_time <= 0:
+            self.then_run()
+
+    def tick(self):
+        time_left = self.end_time - pygame.time.get_ticks()
+        if self.game.prebuilder.step(PREBUILD_TIME_PER_FRAME / 1000):  # Only sleeps once the next map is ready
+            time_left = 0
+        self.game.events(min(time_left, MENU_WAIT_TIME))
+        if self.game.running and pygame.time.get_ticks() >= self.end_time:
+            self.then_run()
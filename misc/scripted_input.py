@@ -0,0 +1,53 @@
+"""Contains the classes used to control the player without a keyboard, like when the game is run headless for testing
+or profiling"""
+import pygame
+
+key_names = {"LEFT": pygame.K_LEFT,
+             "RIGHT": pygame.K_RIGHT,
+             "UP": pygame.K_UP,
+             "SPACE": pygame.K_SPACE,
+             "C": pygame.K_c}
+
+
+class KeyState:
+    """Stands in for what 'pygame.key.get_pressed()' returns: indexing it with a key gives whether it's pressed"""
+    def __init__(self, pressed_keys=()):
+        self.pressed_keys = set(pressed_keys)
+
+    def __getitem__(self, key) -> bool:
+        return key in self.pressed_keys
+
+
+class ScriptedInput:
+    """Presses keys according to a script, which is a list of (keys, number of ticks) steps. Each time it is called
+    (once per tick, by the player) it returns the KeyState for that tick. After the last step no keys are pressed, or
+    the script starts again if loop is True."""
+    def __init__(self, steps, loop: bool = False):
+        self.steps = [(KeyState(keys), ticks) for keys, ticks in steps]
+        self.loop = loop
+        self.tick = 0
+        self.length = sum(ticks for _, ticks in self.steps)
+
+    @classmethod
+    def from_string(cls, script: str, loop: bool = False):
+        """Reads a script like 'RIGHT*60 RIGHT+SPACE*1 -*30', which holds right for 60 ticks, then right and space for
+        1 tick, then presses nothing for 30 ticks. Key names are the keys of 'key_names'."""
+        steps = []
+        for step in script.split():
+            keys, ticks = step.rsplit("*", 1)
+            keys = [] if keys == "-" else [key_names[name.upper()] for name in keys.split("+")]
+            steps.append((keys, int(ticks)))
+        return cls(steps, loop)
+
+    def is_finished(self) -> bool:
+        return not self.loop and self.tick >= self.length
+
+    def __call__(self) -> KeyState:
+        tick = self.tick % self.length if self.loop and self.length else self.tick
+        self.tick += 1
+
+        for key_state, ticks in self.steps:
+            if tick < ticks:
+                return key_state
+            tick -= ticks
+        return KeyState()
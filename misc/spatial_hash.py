@@ -0,0 +1,84 @@
+"""Contains the spatial hash used as a broad phase for collisions, so that an entity only has to be checked against the
+sprites in the grid cells around it instead of against every sprite in a group"""
+from math import floor
+
+
+class SpatialHash:
+    """A uniform grid that buckets sprites by the cells their rect covers on the map"""
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> {sprite: None}, dicts are used as ordered sets
+        self.sprite_cells = {}  # sprite -> list of (column, row) it has been put into
+        self.order = {}  # sprite -> when it was first added, so queries give sprites back in the order they were added
+        self.sprites_added = 0
+
+    def clear(self):
+        """Empties the grid, used whenever a new map is being loaded"""
+        self.cells.clear()
+        self.sprite_cells.clear()
+        self.order.clear()
+        self.sprites_added = 0
+
+    def get_cell_range(self, rect):
+        """Returns the first and last column and row that the rect covers"""
+        return (floor(rect.left / self.cell_size), floor((rect.right - 1) / self.cell_size),
+                floor(rect.top / self.cell_size), floor((rect.bottom - 1) / self.cell_size))
+
+    def get_cells(self, rect):
+        """Returns every (column, row) that the rect covers"""
+        left, right, top, bottom = self.get_cell_range(rect)
+        return [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
+
+    def insert(self, sprite):
+        """Adds the sprite to every cell its rect is currently in"""
+        if sprite in self.sprite_cells:
+            self.remove_from_cells(sprite)
+        else:
+            self.order[sprite] = self.sprites_added
+            self.sprites_added += 1
+
+        cells = self.get_cells(sprite.rect)
+        for cell in cells:
+            self.cells.setdefault(cell, {})[sprite] = None
+        self.sprite_cells[sprite] = cells
+
+    def move(self, sprite):
+        """Moves the sprite into the cells it is in now, if it has been added to the grid"""
+        cells = self.sprite_cells.get(sprite)
+        if cells is not None and cells != self.get_cells(sprite.rect):
+            self.insert(sprite)
+
+    def remove(self, sprite):
+        """Takes the sprite out of the grid, does nothing if the sprite was never added"""
+        self.remove_from_cells(sprite)
+        self.order.pop(sprite, None)
+
+    def remove_from_cells(self, sprite):
+        for cell in self.sprite_cells.pop(sprite, []):
+            bucket = self.cells[cell]
+            del bucket[sprite]
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, rect):
+        """Returns the sprites in the cells the rect covers, in the order they were added"""
+        found = {}
+        left, right, top, bottom = self.get_cell_range(rect)
+        if (right - left + 1) * (bottom - top + 1) > len(self.cells):  # Quicker to look through the filled cells
+            for (column, row), bucket in self.cells.items():
+                if left <= column <= right and top <= row <= bottom:
+                    found.update(bucket)
+        else:
+            for cell in self.get_cells(rect):
+                bucket = self.cells.get(cell)
+                if bucket:
+                    found.update(bucket)
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=self.order.__getitem__)
+
+    def __len__(self):
+        return len(self.sprite_cells)
+
+    def __iter__(self):
+        return iter(self.sprite_cells)
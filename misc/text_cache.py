@@ -0,0 +1,57 @@
+"""Contains the font registry and the rendered text cache. Each size of the game's font is only opened once, and text
+that is shown again (like the menus' titles and button labels) is only rendered once and then reused."""
+from collections import OrderedDict
+
+import pygame
+
+from misc.constants import TEXT_CACHE_SIZE
+
+FONT_FILE = "courier.ttf"
+
+fonts = {}  # size -> pygame.font.Font
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Returns the game's font at the size, opening it the first time that size is needed"""
+    font = fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(FONT_FILE, size)
+        fonts[size] = font
+    return font
+
+
+class TextCache:
+    """The most recently used rendered text, up to max_size of them. Once it's full, the text that was used least
+    recently is forgotten."""
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.images = OrderedDict()  # (text, colour, size) -> rendered text, least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text: str, colour, size: int) -> pygame.Surface:
+        """Returns the text rendered in the colour. The same surface is returned every time for the same text, so it
+        must never be drawn onto."""
+        key = (text, tuple(colour), size)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = get_font(size).render(text, True, colour)
+        self.images[key] = image
+        if len(self.images) > self.max_size:
+            self.images.popitem(last=False)
+        return image
+
+    def get_stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.images), "max_size": self.max_size}
+
+
+text_cache = TextCache(TEXT_CACHE_SIZE)
+
+
+def render_text(text: str, colour, size: int) -> pygame.Surface:
+    return text_cache.render(text, colour, size)
@@ -0,0 +1,73 @@
+"""Contains the static tile layer, which draws all the tiles that never move onto a few large surfaces once per map so
+that they don't have to be drawn one by one every tick"""
+import pygame
+
+
+class StaticTileLayer:
+    """The static tiles of one map, split up into square chunks. Each chunk is only drawn again when one of its tiles
+    is removed (like a disappearing block) or put back."""
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.tiles = {}  # (chunk_x, chunk_y) -> {(x, y): image} of the tiles in that chunk
+        self.removed_tiles = {}  # (x, y) -> image, so that they can be put back when the map is loaded again
+        self.chunk_surfaces = {}
+        self.dirty_chunks = set()  # Chunks that need to be drawn again before they are next shown
+        self.changed_tiles = []  # Rects of the tiles removed since the renderer last looked
+
+    def get_chunk(self, x, y):
+        """Returns the chunk that the position on the map is in"""
+        return x // self.chunk_size, y // self.chunk_size
+
+    def add_tile(self, sprite):
+        self.add_image(sprite.rect.topleft, sprite.image)
+
+    def add_image(self, position, image):
+        """Adds a tile's image at its position on the map"""
+        chunk = self.get_chunk(*position)
+        self.tiles.setdefault(chunk, {})[position] = image
+        self.dirty_chunks.add(chunk)
+
+    def remove_tile(self, sprite):
+        """Takes the tile out of its chunk, run when a disappearing block disappears"""
+        chunk = self.get_chunk(sprite.rect.x, sprite.rect.y)
+        image = self.tiles.get(chunk, {}).pop(sprite.rect.topleft, None)
+        if image is not None:
+            self.removed_tiles[sprite.rect.topleft] = image
+            self.dirty_chunks.add(chunk)
+            self.changed_tiles.append(sprite.rect.copy())
+
+    def reset(self):
+        """Puts back any tiles that were removed the last time the map was played"""
+        for position, image in self.removed_tiles.items():
+            chunk = self.get_chunk(*position)
+            self.tiles[chunk][position] = image
+            self.dirty_chunks.add(chunk)
+        self.removed_tiles.clear()
+
+    def bake_chunk(self, chunk):
+        """Draws all the tiles of a chunk onto its surface"""
+        surface = self.chunk_surfaces.get(chunk)
+        if surface is None:
+            surface = pygame.Surface((self.chunk_size, self.chunk_size), pygame.SRCALPHA).convert_alpha()
+            self.chunk_surfaces[chunk] = surface
+        surface.fill((0, 0, 0, 0))
+
+        chunk_x, chunk_y = chunk[0] * self.chunk_size, chunk[1] * self.chunk_size
+        surface.blits([(image, (x - chunk_x, y - chunk_y)) for (x, y), image in self.tiles[chunk].items()], False)
+        self.dirty_chunks.discard(chunk)
+
+    def draw(self, screen, camera):
+        """Draws the chunks that are on the screen"""
+        width, height = screen.get_size()
+        left, top = self.get_chunk(-camera.x, -camera.y)
+        right, bottom = self.get_chunk(width - 1 - camera.x, height - 1 - camera.y)
+
+        for chunk_x in range(left, right + 1):
+            for chunk_y in range(top, bottom + 1):
+                chunk = (chunk_x, chunk_y)
+                if chunk not in self.tiles:
+                    continue
+                if chunk in self.dirty_chunks:
+                    self.bake_chunk(chunk)
+                screen.blit(self.chunk_surfaces[chunk],
+                            (chunk_x * self.chunk_size + camera.x, chunk_y * self.chunk_size + camera.y))
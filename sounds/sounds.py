@@ -1,6 +1,14 @@
 from enum import Enum, auto
+
+import pygame
 from pygame import mixer
 
+from misc.assets import assets
+
+MUSIC_CHANNELS = 2  # Two so that one track can fade out while the next one fades in
+EFFECT_CHANNELS = 8
+MUSIC_FADE_MS = 1000
+
 
 class SoundName(Enum):
     COIN_COLLECTED = auto()
@@ -18,7 +26,7 @@ class SoundName(Enum):
         return "sounds/" + self.name.lower() + ".wav"
 
     def get_sound(self):
-        return mixer.Sound(self.get_file_name())
+        return assets.get_sound(self.get_file_name())
 
     @classmethod
     def get_all(cls):
@@ -39,18 +47,150 @@ class MusicName(Enum):
         return [_ for _ in cls]
 
 
+def is_mixer_ready() -> bool:
+    """Sounds can only be decoded and played once the mixer has started (it won't if there's no audio device). The
+    first channels are reserved for the music so that sound effects never take them."""
+    if not mixer.get_init():
+        return False
+    if mixer.get_num_channels() != MUSIC_CHANNELS + EFFECT_CHANNELS:
+        mixer.set_num_channels(MUSIC_CHANNELS + EFFECT_CHANNELS)
+        mixer.set_reserved(MUSIC_CHANNELS)
+    return True
+
+
+class SoundBank:
+    """Decodes each sound effect once (either all in the background at startup with 'preload', or the first time it is
+    played) and plays them through a fixed pool of mixer channels, with a limit on how many copies of one sound play at
+    once."""
+    def __init__(self):
+        self.sounds = {}  # SoundName -> mixer.Sound
+        self.channels = []  # The pool of channels, least recently started first
+        self.playing = {}  # SoundName -> channels that were last given that sound, oldest first
+
+    def preload(self):
+        """Starts decoding every sound on the asset manager's threads, so nothing has to be read from the disk during
+        the game"""
+        if is_mixer_ready():
+            for sound in SoundName.get_all():
+                assets.preload_sound(sound.get_file_name())
+
+    def get_sound(self, sound: SoundName):
+        if sound not in self.sounds:
+            self.sounds[sound] = sound.get_sound()
+        return self.sounds[sound]
+
+    def get_free_channel(self):
+        """Returns a channel that isn't playing anything, or the one that started playing longest ago"""
+        if not self.channels:
+            self.channels = [mixer.Channel(i) for i in range(MUSIC_CHANNELS, MUSIC_CHANNELS + EFFECT_CHANNELS)]
+
+        for channel in self.channels:
+            if not channel.get_busy():
+                return channel
+        return self.channels[0]
+
+    def play(self, sound: SoundName):
+        """Plays the sound on a free channel. If the sound is already playing as many times as it is allowed to, the
+        oldest copy is restarted instead."""
+        if not is_mixer_ready():
+            return
+
+        mixer_sound = self.get_sound(sound)
+        channels = [channel for channel in self.playing.get(sound, [])
+                    if channel.get_busy() and channel.get_sound() is mixer_sound]
+
+        if len(channels) >= max_playing_at_once.get(sound, 1):
+            channel = channels.pop(0)
+        else:
+            channel = self.get_free_channel()
+
+        channel.play(mixer_sound)
+        channels.append(channel)
+        self.playing[sound] = channels
+
+        self.channels.remove(channel)  # Moves the channel to the back of the pool as it is now the newest
+        self.channels.append(channel)
+
+
 def play_sound(sound: SoundName):
-    mixer.Sound.play(sound.get_sound())
+    sound_bank.play(sound)
+
+
+class MusicManager:
+    """Plays the background music on the two reserved channels, so that one track can fade into the next. Tracks are
+    decoded on the asset manager's threads ahead of time (with 'preload'), so changing track never waits for the
+    disk."""
+    def __init__(self):
+        self.current_channel = 0
+        self.is_paused = False
+        self.wanted_track = None  # The track to start playing once it has finished being decoded
+        self.fade_ms = 0  # How long the wanted track takes to fade in
+
+    def preload(self, music: MusicName):
+        """Starts decoding the track in the background, if that hasn't already been done"""
+        if music is not None and is_mixer_ready():
+            assets.preload_sound(music.get_file_name())
+
+    @staticmethod
+    def get_track(music: MusicName):
+        """Returns the decoded track, or None if it couldn't be loaded"""
+        try:
+            return assets.get_sound(music.get_file_name())
+        except (pygame.error, FileNotFoundError):
+            return None  # Carries on without music rather than crashing the game
+
+    def play(self, music: MusicName, fade_ms: int = 0):
+        """Fades out the current track and fades in the new one. If the new track hasn't been decoded yet it starts as
+        soon as it has been (see 'update')"""
+        self.wanted_track = music
+        self.fade_ms = fade_ms
+        self.preload(music)
+        self.update()
 
+    def update(self):
+        """Starts the wanted track if it is ready. Needs to be run regularly (it's run by Game.events)."""
+        if self.wanted_track is None or not assets.is_ready(self.wanted_track.get_file_name()):
+            return
 
-def play_music(music: MusicName):
-    mixer.music.load(music.get_file_name())
-    mixer.music.play(-1)
+        old_channel = mixer.Channel(self.current_channel)
+        if self.is_paused or not self.fade_ms:
+            old_channel.stop()
+        else:
+            old_channel.fadeout(self.fade_ms)
+
+        track = self.get_track(self.wanted_track)
+        self.wanted_track = None
+        self.is_paused = False
+        if track is not None:
+            self.current_channel = (self.current_channel + 1) % MUSIC_CHANNELS
+            mixer.Channel(self.current_channel).play(track, loops=-1, fade_ms=self.fade_ms)
+
+    def pause(self):
+        self.wanted_track = None
+        if is_mixer_ready():
+            mixer.Channel(self.current_channel).pause()
+            self.is_paused = True
+
+
+def play_music(music: MusicName, fade_ms: int = MUSIC_FADE_MS):
+    music_manager.play(music, fade_ms)
+
+
+def preload_music(music: MusicName):
+    music_manager.preload(music)
+
+
+def update_music():
+    music_manager.update()
 
 
 def pause_music():
-    mixer.music.pause()
+    music_manager.pause()
+
 
+max_playing_at_once = {SoundName.COIN_COLLECTED: 3,
+                       SoundName.STOMP: 2,
+                       SoundName.JUMP: 2}  # Any sound not in here can only play once at a time
 
-all_sounds = SoundName.get_all()
-all_music = MusicName.get_all()
\ No newline at end of file
+sound_bank = SoundBank()
+music_manager = MusicManager()
\ No newline at end of file
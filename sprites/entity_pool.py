@@ -0,0 +1,64 @@
+"""Contains the entity pools, which keep the unused instances of each entity class so they can be reused instead of
+creating new ones every time a map is loaded"""
+from collections import deque
+
+all_pools = []
+
+
+class EntityPool:
+    """The unused instances of one entity class. Getting and returning an instance are both O(1). Instances are
+    reused in the order they were returned."""
+    def __init__(self, entity_class):
+        self.entity_class = entity_class
+        self.unused_instances = deque()
+
+        self.hits = 0  # Times an unused instance was reused
+        self.misses = 0  # Times a new instance had to be created as there wasn't an unused one
+        self.peak_size = 0  # The most unused instances there have been at once
+        all_pools.append(self)
+
+    def acquire(self):
+        """Returns an unused instance, or None if there aren't any"""
+        if self.unused_instances:
+            self.hits += 1
+            return self.unused_instances.popleft()
+        self.misses += 1
+        return None
+
+    def acquire_many(self, count: int) -> list:
+        """Returns up to count unused instances. The rest are counted as misses, as they will have to be created."""
+        instances = [self.unused_instances.popleft() for _ in range(min(count, len(self.unused_instances)))]
+        self.hits += len(instances)
+        self.misses += count - len(instances)
+        return instances
+
+    def reset(self):
+        """Forgets the unused instances and the stats"""
+        self.unused_instances.clear()
+        self.hits = self.misses = self.peak_size = 0
+
+    def release(self, instance):
+        self.unused_instances.append(instance)
+        self.peak_size = max(self.peak_size, len(self.unused_instances))
+
+    def prewarm(self, game, size: int, *args):
+        """Creates unused instances until there are at least size of them, so that loading a map doesn't have to"""
+        while len(self.unused_instances) < size:
+            instance = self.entity_class(game, 0, 0, *args)
+            game.all_sprites_group.remove(instance)  # It was never shown, so there's nothing else to take it out of
+            self.release(instance)
+
+    def get_stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.unused_instances),
+                "peak_size": self.peak_size}
+
+
+def reset_pools():
+    """Empties every pool. Run when a game starts, as the unused instances belong to the game that created them."""
+    for pool in all_pools:
+        pool.reset()
+
+
+def get_pool_stats() -> dict:
+    """Returns the stats of every pool that has been used, by class name"""
+    return {pool.entity_class.__name__: pool.get_stats() for pool in all_pools if pool.hits or pool.misses}
@@ -0,0 +1,22 @@
+"""Contains the cache of animation frames, so that scaling and flipping sprite images is done once when the animations
+are loaded rather than every tick in the animate functions"""
+import pygame
+
+from misc.constants import SCALE_UP
+
+frame_cache = {}  # (spritesheet name, x, y, width, height, scale, flipped) -> the finished frame
+
+
+def get_frame(spritesheet, x: int, y: int, width: int, height: int, flip: bool = False):
+    """Returns the sprite at x, y on the spritesheet already scaled up (and flipped horizontally if flip is True).
+    Frames are shared by every entity that uses them, so they must never be drawn onto."""
+    key = (spritesheet.name, x, y, width, height, SCALE_UP, flip)
+    frame = frame_cache.get(key)
+    if frame is None:
+        frame = spritesheet.get_specific_sprite(x, y, width, height)
+        frame = pygame.transform.scale(frame, (width * SCALE_UP, height * SCALE_UP))
+        if flip:
+            frame = pygame.transform.flip(frame, True, False)
+        frame.set_colorkey(spritesheet.bg_colour, pygame.RLEACCEL)  # Scaling doesn't keep the RLE acceleration
+        frame_cache[key] = frame
+    return frame
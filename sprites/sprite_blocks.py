@@ -3,71 +3,73 @@ import pygame.sprite
 from sprites.sprite_entity import Entity, EntityGroups, EntityLayer
 from sprites.sprite_sheets import SpriteSheetName
 from misc.constants import BLOCK_SIZE_Y, BLOCK_SIZE_X
+from misc.objectives import Objective
 
 
 class GenericBlock(Entity):
-    """A block entity sprite"""
+    """A block entity sprite, which looks like its class's tile_frame"""
+    is_static_tile = True
 
-    def __init__(self, game, x, y, sprite_x, sprite_y):
-        super().__init__(game, x, y, EntityGroups.BLOCK, EntityLayer.BLOCK, spritesheet_name=SpriteSheetName.BLOCKS,
+    def __init__(self, game, x, y):
+        spritesheet_name, sprite_x, sprite_y = self.tile_frame
+        super().__init__(game, x, y, EntityGroups.BLOCK, EntityLayer.BLOCK, spritesheet_name=spritesheet_name,
                          sprite_x=sprite_x, sprite_y=sprite_y, width=BLOCK_SIZE_X, height=BLOCK_SIZE_Y)
 
 
 class Block(GenericBlock):
     """b: A normal block entity sprite"""
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, sprite_x=68, sprite_y=34)
+    tile_frame = (SpriteSheetName.BLOCKS, 68, 34)
 
 
 class Brick(GenericBlock):
     """B: A normal brick entity sprite"""
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, sprite_x=34, sprite_y=17)
+    tile_frame = (SpriteSheetName.BLOCKS, 34, 17)
 
 
 class Ground(GenericBlock):
     """G: A ground entity sprite"""
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, sprite_x=102, sprite_y=17)
+    tile_frame = (SpriteSheetName.BLOCKS, 102, 17)
 
 
 class Underground(GenericBlock):
     """U: Goes under the ground entity sprite"""
-
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, sprite_x=136, sprite_y=17)
+    tile_frame = (SpriteSheetName.BLOCKS, 136, 17)
 
 
-class InvisibleWall(Entity):
+class InvisibleWall(GenericBlock):
     """I: An invisible block entity sprite"""
+    tile_frame = (SpriteSheetName.INVISIBLE_WALL, 1, 31)
 
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, EntityGroups.BLOCK, EntityLayer.BLOCK,
-                         spritesheet_name=SpriteSheetName.INVISIBLE_WALL,
-                         sprite_x=1, sprite_y=31, width=BLOCK_SIZE_X, height=BLOCK_SIZE_Y)
 
+class DisappearingBlock(GenericBlock):
+    """General class for blocks that disappear once all of their objectives are complete"""
+    can_disappear = True
+    objectives = ()
+
+    def spawned(self):
+        super().spawned()
+        self.game.objectives.when_complete(self.objectives, self.remove_from_screen)
 
-class EnemyDisappearingBlock(GenericBlock):
-    """d: A block that disappears when all the enemies in the room have been killed."""
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, sprite_x=0, sprite_y=34)
 
-    def update(self):
-        if self.game.no_more_enemies:
-            self.remove_from_screen()
+class EnemyDisappearingBlock(DisappearingBlock):
+    """d: A block that disappears when all the enemies in the room have been killed."""
+    objectives = (Objective.ENEMIES,)
+    tile_frame = (SpriteSheetName.BLOCKS, 0, 34)
 
 
-class GoalDisappearingBlock(GenericBlock):
-    """D: A block that disappears when all the enemies in the room have been killed."""
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y, sprite_x=34, sprite_y=34)
+class GoalDisappearingBlock(DisappearingBlock):
+    """D: A block that disappears when all the enemies in the room have been killed, all the coins have been collected
+    and the key has been found."""
+    objectives = (Objective.ENEMIES, Objective.COINS, Objective.KEYS)
+    tile_frame = (SpriteSheetName.BLOCKS, 34, 34)
 
-    def update(self):
-        if self.game.no_more_enemies and self.game.coins_collected and self.game.key_found:
-            self.remove_from_screen()
 
 class GoalLandingBlock(Entity):
     """g: A block that disappears when all the enemies in the room have been killed."""
+    is_static_tile = True
+    tile_frame = (SpriteSheetName.BLOCKS, 17, 34)
+
     def __init__(self, game, x, y):
-        super().__init__(game, x, y, EntityGroups.GOAL_BLOCK, EntityLayer.BLOCK, spritesheet_name=SpriteSheetName.BLOCKS,
-                         sprite_x=17, sprite_y=34, width=BLOCK_SIZE_X, height=BLOCK_SIZE_Y)
\ No newline at end of file
+        spritesheet_name, sprite_x, sprite_y = self.tile_frame
+        super().__init__(game, x, y, EntityGroups.GOAL_BLOCK, EntityLayer.BLOCK, spritesheet_name=spritesheet_name,
+                         sprite_x=sprite_x, sprite_y=sprite_y, width=BLOCK_SIZE_X, height=BLOCK_SIZE_Y)
\ No newline at end of file
@@ -1,12 +1,11 @@
 """ Contains the general class for the player_group/npcs """
 from math import floor
 
-import pygame
-
 from misc.constants import *
 from sprites.animations import Animations, EntityState
 from sprites.sprite_entity import Entity, EntityLayer, EntityGroups
 from sprites.sprite_sheets import SpriteSheetName
+from misc.objectives import Objective
 from enum import Enum, auto
 
 class EnemyType(Enum):
@@ -29,6 +28,9 @@ enemy_information = {EnemyType.SNAKE: [SpriteSheetName.SNAKE_ENEMY, Animations.S
 
 class Enemy(Entity):
     """General class for enemies_group"""
+    needs_update = True
+    objective = Objective.ENEMIES
+
     def __init__(self, game, x: int, y: int, enemy_type: EnemyType, width: int, height: int):
         super().__init__(game, x, y, EntityGroups.ENEMY, EntityLayer.PERSON, spritesheet_name=enemy_type.get_spritesheet_name(),
                          sprite_x=0, sprite_y=0, width=width, height=height)
@@ -53,7 +55,7 @@ class Enemy(Entity):
             self.animate()
             self.gravity()
 
-            if self.rect.y >= self.game.size[0]:
+            if self.game.camera.apply(self.rect).y >= self.game.size[0]:
                 self.death()
 
             self.rect.x += self.dx  # Updates position of player_group
@@ -68,7 +70,7 @@ class Enemy(Entity):
                 self.death_counter -= 1
             else:
                 self.remove_from_screen()
-                self.game.no_more_enemies = not self.game.is_group_on_screen(self.game.enemies_group)
+                self.game.objectives.complete(self.objective)
 
     def move(self):
         """Actually changes dx value"""
@@ -85,15 +87,15 @@ class Enemy(Entity):
         animations = {}
 
         for enemy_state in animations_enum.value:
-            animation_list = self.get_animation_sprites(animations_enum.value[enemy_state])
+            animation_list = self.get_animation_sprites(animations_enum.value[enemy_state], self.is_flipped(enemy_state))
             if type(animation_list) is not list:
                 animation_list = [animation_list]
             animations[enemy_state] = animation_list
 
         return animations
 
-    def get_animation_sprites(self, coordinates_list: list):
-        """Helper function for process animations: takes each list and applies get_sprite function onto each x,y
+    def get_animation_sprites(self, coordinates_list: list, flip: bool = False):
+        """Helper function for process animations: takes each list and applies get_frame function onto each x,y
         coordinate pairs and returns the list in the same format and size as it was before"""
         new_list = []
         x_coord = None
@@ -101,7 +103,7 @@ class Enemy(Entity):
         for item in range(len(coordinates_list)):
             if type(coordinates_list[item]) is list:  # If we've encountered a pair of coordinates or more, as opposed
                 # to just a single coordinate.
-                new_list.append(self.get_animation_sprites(coordinates_list[item]))  # Recursively calls algorithm until
+                new_list.append(self.get_animation_sprites(coordinates_list[item], flip))  # Recursively calls algorithm until
                 # the for loop is iterating through a pair of coordinates and not a multidimensional list
 
             else:  # This is when the algorithm is iterating through a pair of coordinates and coordinates_list[item] is
@@ -109,7 +111,7 @@ class Enemy(Entity):
                 if x_coord is None:  # If this is true then coordinates_list[item] = the x coordinate.
                     x_coord = coordinates_list[item]
                 else:  # Otherwise, coordinates_list[item] = the y coordinate.
-                    new_list.append(self.get_image(x_coord, coordinates_list[item]))
+                    new_list.append(self.get_frame(x_coord, coordinates_list[item], flip))
         if len(new_list) == 1:  # This is during the recursive stage when new_list = [SurfaceObj], but I want the
             # SurfaceObj by itself so the next line takes it out of the list.
             new_list = new_list[0]
@@ -128,18 +130,16 @@ class Enemy(Entity):
         else:
             self.image = animations[0]
 
-        self.image = pygame.transform.scale(self.image, (self.width * SCALE_UP, self.height * SCALE_UP))  # As these images have not
-        # been scaled
-        if self.enemy_state is EntityState.GROUNDED_LEFT and self.spritesheet.name != "enemies":
-            self.image = pygame.transform.flip(self.image, True, False)
-
-        if self.enemy_state is EntityState.GROUNDED_RIGHT and self.spritesheet.name == "enemies":
-            self.image = pygame.transform.flip(self.image, True, False)
+    def is_flipped(self, enemy_state: EntityState) -> bool:
+        """The snake faces right on its spritesheet, but the enemies on the 'enemies' spritesheet face left"""
+        if enemy_state is EntityState.GROUNDED_LEFT and self.spritesheet.name != "enemies":
+            return True
+        return enemy_state is EntityState.GROUNDED_RIGHT and self.spritesheet.name == "enemies"
 
     # __________________________________________COLLISION FUNCTIONS__________________________________________
     def x_collide(self):
         """Detects a horizontal collision and acts on it to stop player_group going through objects/entities."""
-        hit_block = pygame.sprite.spritecollide(self, self.game.blocks_group, False)
+        hit_block = self.game.get_hit_blocks(self)
         # hit_block[0] will refer to the block hit
 
         # If collision is horizontal
@@ -154,7 +154,7 @@ class Enemy(Entity):
 
     def y_collide(self):
         """Detects a vertical collision and acts on it to stop player_group going through objects/entities."""
-        hit_block = pygame.sprite.spritecollide(self, self.game.blocks_group, False)
+        hit_block = self.game.get_hit_blocks(self)
 
         if hit_block:
             if self.dy > 0:  # Player hits ground
@@ -6,6 +6,9 @@ from enum import Enum, auto
 
 from sprites.animations import Animations, EntityState
 from sprites.sprite_sheets import SpriteSheetName
+from sprites.frame_cache import get_frame
+from sprites.entity_pool import EntityPool
+from misc.objectives import Objective
 
 
 class EntityLayer(int, Enum):
@@ -28,7 +31,7 @@ class EntityGroups(list, Enum):
     COIN = ["coins"]
     KEY = ["keys"]
     GOAL_BLOCK = ["blocks", "goal_blocks"]
-    OVERLAY = ["overlay"]
+    OVERLAY = ["overlay", "hud"]
 
 
 class RotationDirection(int, Enum):
@@ -41,7 +44,16 @@ class RotationDirection(int, Enum):
 
 class Entity(pygame.sprite.Sprite):
     """Base class for all entities"""
-    unused_instances = []
+    pool = None  # Every child class gets its own EntityPool of unused instances
+    is_static_tile = False  # Static tiles never move, so they are drawn by the game's StaticTileLayer instead
+    needs_update = False  # Whether the sprite's update function does anything, so the game knows to run it
+    can_disappear = False  # Whether the sprite can be removed in the middle of a level, see 'Game.is_merged'
+    objective = None  # The Objective this sprite counts towards, if it has to be collected or killed
+    tile_frame = None  # (spritesheet name, sprite x, sprite y) of a static tile's image, see 'get_tile_image'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.pool = EntityPool(cls)
 
     def __init__(self, game, x: int, y: int, ent_groups=None, layer: EntityLayer = None, spritesheet_name: str = None,
                  sprite_x: int = None, sprite_y: int = None, width: int = None,
@@ -55,10 +67,12 @@ class Entity(pygame.sprite.Sprite):
         self.width = width
         self.height = height
 
+        self.ent_groups = ent_groups
         rem_groups = self.load_rem_groups(ent_groups.value)
         self.groups = tuple([self.game.all_sprites_group] + rem_groups)
         pygame.sprite.Sprite.__init__(self, self.groups)
 
+        self.spritesheet_name = spritesheet_name
         self.spritesheet = game.spritesheets[spritesheet_name]
         self.sprite_coordinates = [sprite_x, sprite_y]
 
@@ -66,8 +80,7 @@ class Entity(pygame.sprite.Sprite):
 
     def get_sprite(self, x, y, rotation_dir: RotationDirection = None):
         """Gets the image and creates the object sprite."""
-        self.image = self.get_image(self.sprite_coordinates[0], self.sprite_coordinates[1])
-        self.image = pygame.transform.scale(self.image, (self.width * SCALE_UP, self.height * SCALE_UP))
+        self.image = self.get_frame(self.sprite_coordinates[0], self.sprite_coordinates[1])
         if rotation_dir is not None:
             self.image = self.image = pygame.transform.rotate(self.image, rotation_dir)
 
@@ -80,6 +93,10 @@ class Entity(pygame.sprite.Sprite):
         """ In order to shorten long statement (self.spritesheet.get_specific_sprite(x, y, self.width, self.height)"""
         return self.spritesheet.get_specific_sprite(x, y, self.width, self.height)
 
+    def get_frame(self, x: int, y: int, flip: bool = False):
+        """Same as get_image, but the image comes already scaled up (and flipped) from the shared frame cache"""
+        return get_frame(self.spritesheet, x, y, self.width, self.height, flip)
+
     def load_rem_groups(self, rem_groups):
         """Uses the strings from the 'EntityGroups' class, retrieves the appropriate groups from the game class returns
         an array with all the groups."""
@@ -91,7 +108,6 @@ class Entity(pygame.sprite.Sprite):
     def show_on_screen(self, new_x: int, new_y: int):
         """When an unused sprite which has been removed off the screen is being shown again."""
         self.game.all_sprites_group.add(self)  # If it's in the all sprites group, then the sprite will be drawn/updated
-        self.unused_instances.remove(self)  # The sprite is now being used.
         self.reset_variables()  # All entities have this, only player and enemy ones actually do something
         self.change_coordinates(new_x, new_y)
 
@@ -99,8 +115,13 @@ class Entity(pygame.sprite.Sprite):
         """Alternative to self.kill(), it removes the sprite from the all_sprites group, which stops the sprite from
         being drawn and updated, and adds it to the unused instances array, so it can be reused again later on."""
         self.game.all_sprites_group.remove(self)
+        self.game.blocks_grid.remove(self)  # So that disappearing blocks can no longer be collided with
+        self.game.entities_grid.remove(self)
+        self.game.hud_group.remove(self)  # For the key, which is shown on the screen once it has been picked up
+        if self.is_static_tile and self.game.tile_layer is not None:
+            self.game.tile_layer.remove_tile(self)
         self.change_coordinates(0, 0)  # In case it could have interfered with something
-        self.unused_instances.append(self)
+        self.pool.release(self)
 
     def change_coordinates(self, new_x: int, new_y: int):
         """Used mainly when an instance of a class is being reused, as it needs new coordinates to be set."""
@@ -109,11 +130,20 @@ class Entity(pygame.sprite.Sprite):
 
     @classmethod
     def find_unused_instance(cls):
-        """To be used with every child class of entity, not entity itself."""
-        for instance in cls.unused_instances:
-            if isinstance(instance, cls):
-                return instance
-        return False
+        """To be used with every child class of entity, not entity itself. Takes an instance out of the class's pool,
+        or returns False if there aren't any."""
+        return cls.pool.acquire() or False
+
+    @classmethod
+    def get_tile_image(cls, game):
+        """Returns the image every instance of a static tile class has, without needing an instance of it"""
+        spritesheet_name, sprite_x, sprite_y = cls.tile_frame
+        return get_frame(game.spritesheets[spritesheet_name], sprite_x, sprite_y, BLOCK_SIZE_X, BLOCK_SIZE_Y)
+
+    @classmethod
+    def prewarm_pool(cls, game, size: int, *args):
+        """Creates unused instances so that there are at least size of them ready to be reused"""
+        cls.pool.prewarm(game, size, *args)
 
     @classmethod
     def create_instance(cls, game, x, y, rotation_dir: RotationDirection = None):
@@ -122,17 +152,54 @@ class Entity(pygame.sprite.Sprite):
         it creates a new instance."""
         instance_found = cls.find_unused_instance()
         if instance_found:
-            instance_found.show_on_screen(x, y)
-
-            if rotation_dir is not None:  # for pipes or other rotatable objects.
-                instance_found.get_sprite(x, y, rotation_dir)
-                instance_found.set_rotation_dir(rotation_dir)
+            instance_found.reuse(game, x, y, rotation_dir)
+        elif rotation_dir is None:
+            instance_found = cls(game, x, y)  # if unused instance is not found then a new instance is created.
+        else:
+            instance_found = cls(game, x, y, rotation_dir)  # for pipes or other rotatable objects.
+        instance_found.spawned()
+        return instance_found
 
-            return instance_found
+    @classmethod
+    def create_instances(cls, game, positions: list, rotation_dir: RotationDirection = None) -> list:
+        """Same as running create_instance for every (x, y) in positions"""
+        unused_instances = cls.pool.acquire_many(len(positions))
+        for instance, (x, y) in zip(unused_instances, positions):
+            instance.reuse(game, x, y, rotation_dir)
+            instance.spawned()
 
         if rotation_dir is None:
-            return cls(game, x, y)  # if unused instance is not found then a new instance is created.
-        return cls(game, x, y, rotation_dir)  # for pipes or other rotatable objects.
+            new_instances = [cls(game, x, y) for x, y in positions[len(unused_instances):]]
+        else:
+            new_instances = [cls(game, x, y, rotation_dir) for x, y in positions[len(unused_instances):]]
+        for instance in new_instances:
+            instance.spawned()
+        return unused_instances + new_instances
+
+    def reuse(self, game, x, y, rotation_dir: RotationDirection = None):
+        """Shows an unused instance on the screen again at x, y"""
+        if self.game is not game:
+            self.change_game(game)
+        self.show_on_screen(x, y)
+
+        if rotation_dir is not None:  # for pipes or other rotatable objects.
+            self.get_sprite(x, y, rotation_dir)
+            self.set_rotation_dir(rotation_dir)
+
+    def change_game(self, game):
+        """Moves the instance over to another game's sprite groups and spritesheets, in case it was left in its pool
+        by a game that has finished"""
+        self.kill()
+        self.game = game
+        self.groups = tuple([game.all_sprites_group] + self.load_rem_groups(self.ent_groups.value))
+        self.add(self.groups)
+        self.spritesheet = game.spritesheets[self.spritesheet_name]
+
+    def spawned(self):
+        """Run when the entity is put on the map (whether it was just created or reused), but not when it's only
+        created to fill its pool"""
+        if self.objective is not None:
+            self.game.objectives.add(self.objective)
 
     def reset_variables(self):
         """If sprite is reused, then these variables need to be reset. This is a placeholder function for any children
@@ -146,14 +213,17 @@ class Entity(pygame.sprite.Sprite):
 
 class Key(Entity):
     """A key entity sprite"""
+    objective = Objective.KEYS
 
     def __init__(self, game, x, y):
         super().__init__(game, x, y, EntityGroups.KEY, EntityLayer.PERSON, spritesheet_name=SpriteSheetName.KEY,
                          sprite_x=6, sprite_y=8, width=BLOCK_SIZE_X, height=BLOCK_SIZE_Y)
 
     def picked_up(self):
-        self.game.key_found = True
+        self.game.objectives.complete(self.objective)
         self._layer = EntityLayer.PIPE  # Want to put it in front of everything
+        self.game.hud_group.add(self)  # Stays in the top left of the screen rather than on the map
+        self.game.entities_grid.remove(self)
         self.rect.x = 0
         self.rect.y = 33
 
@@ -175,6 +245,9 @@ class Pipe(Entity):
 
 class Coin(Entity):
     """C: A coin object"""
+    needs_update = True
+    objective = Objective.COINS
+
     def __init__(self, game, x, y):
         super().__init__(game, x, y, EntityGroups.COIN, EntityLayer.PERSON, spritesheet_name=SpriteSheetName.ROTATING_COIN,
                          sprite_x=6, sprite_y=6, width=6, height=6)
@@ -182,7 +255,7 @@ class Coin(Entity):
         self.animation_loop = 1
 
     def get_animation_sprites(self, coordinates_list: list):
-        """Takes each list and applies get_sprite function onto each x,y coordinate pairs and returns the list in the
+        """Takes each list and applies get_frame function onto each x,y coordinate pairs and returns the list in the
         same format and size as it was before"""
         new_list = []
         x_coord = None
@@ -198,7 +271,7 @@ class Coin(Entity):
                 if x_coord is None:  # If this is true then coordinates_list[item] = the x coordinate.
                     x_coord = coordinates_list[item]
                 else:  # Otherwise, coordinates_list[item] = the y coordinate.
-                    new_list.append(self.get_image(x_coord, coordinates_list[item]))
+                    new_list.append(self.get_frame(x_coord, coordinates_list[item]))
         if len(new_list) == 1:  # This is during the recursive stage when new_list = [SurfaceObj], but I want the
             # SurfaceObj by itself so the next line takes it out of the list.
             new_list = new_list[0]
@@ -209,7 +282,7 @@ class Coin(Entity):
 
     def picked_up(self):
         self.remove_from_screen()
-        self.game.coins_collected = not self.game.is_group_on_screen(self.game.coins_group)
+        self.game.objectives.complete(self.objective)
 
     def animate(self):
         """Selects sprites to display for whatever the player_group is doing. If moving there is an animation loop played"""
@@ -218,7 +291,5 @@ class Coin(Entity):
         if self.animation_loop >= len(self.animations):
             self.animation_loop = 0
 
-        self.image = pygame.transform.scale(self.image, (self.width * SCALE_UP, self.height * SCALE_UP))
-
 
 
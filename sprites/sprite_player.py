@@ -9,11 +9,14 @@ from sprites.animations import Animations, EntityState
 from sprites.sprite_entity import Entity, EntityLayer, EntityGroups, RotationDirection
 from sprites.sprite_sheets import SpriteSheetName
 from sounds.sounds import SoundName
-from time import sleep
+from misc.cutscene import wait
+from misc.objectives import Objective
 
 
 class Player(Entity):
     """General class for Player/NPC"""
+    needs_update = True
+
     def __init__(self, game, x, y):
         super().__init__(game, x, y, EntityGroups.PLAYER, EntityLayer.PERSON, spritesheet_name=SpriteSheetName.PLAYER,
                          sprite_x=209, sprite_y=52, width=30, height=30)
@@ -40,7 +43,7 @@ class Player(Entity):
         self.gravity()
         self.is_on_ground = False
 
-        if self.rect.y >= self.game.size[0]:
+        if self.game.camera.apply(self.rect).y >= self.game.size[0]:
             self.death()
 
         self.specific_entity_collide()
@@ -60,8 +63,8 @@ class Player(Entity):
     def detect_movement(self):
         """Determines whether a movement is happening and potentially changes movement speed, the entity state and runs
         the move() or jump() functions if the appropriate keys have been pressed."""
-        key_pressed = pygame.key.get_pressed()  # Creates huge array of each key and a boolean value of whether they
-        # were pressed
+        key_pressed = self.game.get_pressed_keys()  # Creates huge array of each key and a boolean value of whether
+        # they were pressed
 
         if key_pressed[pygame.K_c]:  # RUN
             self.speed = P_RUNNING_SPEED
@@ -97,10 +100,7 @@ class Player(Entity):
             coordinate_change *= -1  # Makes number negative if the person's moving left
 
         # Camera Movement:
-        self.game.move_sprites(-coordinate_change, 0)  # minus is there to move the objects in opposite direction
-
-        if self.game.key_found:
-            [_ for _ in self.game.keys_group][0].rect.x += coordinate_change
+        self.game.camera.move(-coordinate_change, 0)  # minus is there to move the objects in opposite direction
 
         setattr(self, "dx", coordinate_change)  # Changes dx value
 
@@ -110,15 +110,15 @@ class Player(Entity):
         animations = {}
 
         for player_state in animations_enum.value:
-            animation_list = self.get_animation_sprites(animations_enum.value[player_state])
+            animation_list = self.get_animation_sprites(animations_enum.value[player_state], self.is_flipped(player_state))
             if type(animation_list) is not list:
                 animation_list = [animation_list]
             animations[player_state] = animation_list
 
         return animations
 
-    def get_animation_sprites(self, coordinates_list: list):
-        """Helper function for process animations: takes each list and applies get_sprite function onto each x,y
+    def get_animation_sprites(self, coordinates_list: list, flip: bool = False):
+        """Helper function for process animations: takes each list and applies get_frame function onto each x,y
         coordinate pairs and returns the list in the same format and size as it was before"""
         new_list = []
         x_coord = None
@@ -126,7 +126,7 @@ class Player(Entity):
         for item in range(len(coordinates_list)):
             if type(coordinates_list[item]) is list:  # If we've encountered a pair of coordinates or more, as opposed
                 # to just a single coordinate.
-                new_list.append(self.get_animation_sprites(coordinates_list[item]))  # Recursively calls algorithm until
+                new_list.append(self.get_animation_sprites(coordinates_list[item], flip))  # Recursively calls algorithm until
                 # the for loop is iterating through a pair of coordinates and not a multidimensional list
 
             else:  # This is when the algorithm is iterating through a pair of coordinates and coordinates_list[item] is
@@ -134,7 +134,7 @@ class Player(Entity):
                 if x_coord is None:  # If this is true then coordinates_list[item] = the x coordinate.
                     x_coord = coordinates_list[item]
                 else:  # Otherwise, coordinates_list[item] = the y coordinate.
-                    new_list.append(self.get_image(x_coord, coordinates_list[item]))
+                    new_list.append(self.get_frame(x_coord, coordinates_list[item], flip))
         if len(new_list) == 1:  # This is during the recursive stage when new_list = [SurfaceObj], but I want the
             # SurfaceObj by itself so the next line takes it out of the list.
             new_list = new_list[0]
@@ -155,16 +155,16 @@ class Player(Entity):
             if self.animation_loop >= 3:
                 self.animation_loop = 0
 
-        self.image = pygame.transform.scale(self.image, (self.width * SCALE_UP, self.height * SCALE_UP))  # As these images have not
-        # been scaled
-        if self.player_state in [EntityState.GROUNDED_LEFT, EntityState.JUMP_LEFT]:
-            self.image = pygame.transform.flip(self.image, True, False)
+    @staticmethod
+    def is_flipped(player_state: EntityState) -> bool:
+        """The player's sprites face right, so they are flipped when facing left"""
+        return player_state in [EntityState.GROUNDED_LEFT, EntityState.JUMP_LEFT]
 
     # __________________________________________COLLISION FUNCTIONS__________________________________________
     def x_collide(self):
         """Detects a horizontal collision and acts on it to stop player_group going through objects/entities."""
-        hit_block = pygame.sprite.spritecollide(self, self.game.blocks_group, False)
-        hit_pipe = pygame.sprite.spritecollide(self, self.game.pipes_group, False)
+        hit_block = self.game.get_hit_blocks(self)
+        hit_pipe = self.game.collide(self, self.game.pipes_group)
         # hit_block[0] will refer to the block hit
 
         # If collision is horizontal
@@ -174,27 +174,23 @@ class Player(Entity):
                 self.rect.x = block.rect.left - self.rect.width  # Moves char just to the left of the other object
 
                 # To Reverse Camera Movement:
-                self.game.move_sprites(self.speed, 0)
-                if self.game.key_found:
-                    [_ for _ in self.game.keys_group][0].rect.x -= self.speed
+                self.game.camera.move(self.speed, 0)
 
             elif self.dx < 0:
                 self.rect.x = block.rect.right  # Moves char just to the right of the other object
 
                 # To Reverse Camera Movement:
-                self.game.move_sprites(-self.speed, 0)
-                if self.game.key_found:
-                    [_ for _ in self.game.keys_group][0].rect.x += self.speed
+                self.game.camera.move(-self.speed, 0)
 
-        if hit_pipe and self.game.key_found:
+        if hit_pipe and self.game.objectives.is_complete(Objective.KEYS):
             pipe = hit_pipe[0]
             if self.dx > 0 and pipe.is_entry_pipe():  # Can only enter pipe that faces left
                 self.enter_pipe(pipe)
 
     def y_collide(self):
         """Detects a vertical collision and acts on it to stop player_group going through objects/entities."""
-        hit_block = pygame.sprite.spritecollide(self, self.game.blocks_group, False)
-        hit_goal_block = pygame.sprite.spritecollide(self, self.game.goal_blocks_group, False)
+        hit_block = self.game.get_hit_blocks(self)
+        hit_goal_block = self.game.collide(self, self.game.goal_blocks_group)
 
         if hit_block:
             self.is_jumping = False
@@ -223,7 +219,7 @@ class Player(Entity):
     def enemy_collide(self):
         """Determines whether an enemy collision has occurred. Determines whether this is a death for the player_group or for
         the enemy."""
-        hit_enemy = pygame.sprite.spritecollide(self, self.game.enemies_group, False)
+        hit_enemy = self.game.collide(self, self.game.enemies_group)
         # hit_enemy will create a list of sprites in the enemies_group group that have collided with the player_group.
         # It will have an empty list if there are no collisions, hence the "if hit_enemy" statement below will not run
         # hit_enemy[0] will be the enemy that the player_group collides with.
@@ -239,13 +235,13 @@ class Player(Entity):
                 self.jump(20)  # Smaller jump than usual
 
     def key_collide(self):
-        hit_key = pygame.sprite.spritecollide(self, self.game.keys_group, False)
-        if hit_key:
+        hit_key = self.game.collide(self, self.game.keys_group)
+        if hit_key and hit_key[0] not in self.game.hud_group:  # A picked up key is on the screen, not on the map
             hit_key[0].picked_up()
             self.game.play_sound(SoundName.KEY_COLLECTED)
 
     def coin_collide(self):
-        hit_coin = pygame.sprite.spritecollide(self, self.game.coins_group, False)
+        hit_coin = self.game.collide(self, self.game.coins_group)
         if hit_coin:
             hit_coin[0].picked_up()
             self.game.play_sound(SoundName.COIN_COLLECTED)
@@ -274,25 +270,35 @@ class Player(Entity):
 
     # __________________________________________PLAYER LEAVES MAP FUNCTIONS__________________________________________
     def death(self):
+        if self.game.restart_on_death:
+            self.game.play_cutscene(self.restart_map())
+        else:
+            self.game.play_cutscene(self.death_animation())
+
+    def restart_map(self):
+        """Used instead of the death animation if 'game.restart_on_death' is True. The map is started again in the
+        next update rather than straight away, as the other sprites may still be being updated."""
+        self.game.profiler.count("player deaths")
+        self.game.start_map()
+        yield
+
+    def death_animation(self):
         """Player death animation. Changes into death sprite, waits a little, rises a little and then falls off the
         map. All other sprites are paused during this."""
+        self.game.profiler.count("player deaths")
         self.game.pause_music()
         self.game.play_sound(SoundName.PLAYER_DEATH)
         self.player_state = EntityState.DEATH
         self.animate()
-        self.game.draw()
-        sleep(0.25)
-        while self.rect.y < 700:
+        yield from wait(0.25)
+        while self.game.camera.apply(self.rect).y < 700:
             if self.death_counter != 0:  # When the player_group moves upwards in the death animation
                 self.rect.y -= 3
-                self.game.events()
-                self.game.draw()
                 self.death_counter -= 1
             else:
                 self.rect.y += 4
-                self.game.events()
-                self.game.draw()
-        sleep(1)
+            yield
+        yield from wait(1)
         self.game.num_lives -= 1
         if self.game.num_lives != 0:
             self.game.overlay.set_lives()
@@ -311,14 +317,17 @@ class Player(Entity):
     # __________________________________________________PIPE FUNCTIONS__________________________________________________
     def enter_pipe(self, pipe):
         """The entering of a pipe by a player. Warped to next map in game"""
-        self.pipe_enter_animation(pipe)
-        sleep(0.75)
+        self.game.play_cutscene(self.enter_pipe_animation(pipe))
+
+    def enter_pipe_animation(self, pipe):
+        yield from self.pipe_enter_animation(pipe)
+        yield from wait(0.75)
         self.game.current_map_id = self.game.current_map_id.get_next_map()
         self.game.load_map()
 
     def pipe_enter_animation(self, pipe):
-        self.game.play_sound(SoundName.PIPE_ENTER_EXIT)
         """The animation when a player enters a pipe"""
+        self.game.play_sound(SoundName.PIPE_ENTER_EXIT)
         self.player_state = EntityState.GROUNDED_RIGHT
         self.dx = 0
         self.animate()
@@ -328,14 +337,13 @@ class Player(Entity):
         desired_player_x = pipe.rect.x+1
         while self.rect.x != desired_player_x:
             self.rect.x += 1
-            self.game.events()
-            self.game.draw()
+            yield
 
     def if_exit_pipe(self):
         """Run at the beginning of a map loading to see if the player is meant to come out of a pipe to get into the new map"""
-        hit_pipe = pygame.sprite.spritecollide(self, self.game.pipes_group, False)
+        hit_pipe = self.game.collide(self, self.game.pipes_group)
         if hit_pipe and not hit_pipe[0].is_entry_pipe():
-            self.exit_pipe_animation(hit_pipe[0])
+            self.game.play_cutscene(self.exit_pipe_animation(hit_pipe[0]))
 
     def exit_pipe_animation(self, pipe):
         """The animation when a player exits a pipe"""
@@ -348,30 +356,31 @@ class Player(Entity):
             desired_player_y = pipe.rect.y + pipe.rect.height + 1
             while self.rect.y != desired_player_y:
                 self.rect.y += 1
-                self.game.events()
-                self.game.draw()
+                yield
 
         if pipe.rotation_dir is RotationDirection.RIGHT:
             desired_player_x = pipe.rect.x + pipe.rect.width + 1
             while self.rect.x != desired_player_x:
                 self.rect.x += 1
-                self.game.events()
-                self.game.draw()
+                yield
 
     def finish_level(self):
+        self.game.play_cutscene(self.finish_level_animation())
+
+    def finish_level_animation(self):
+        """The player walks off the screen and the next level is loaded"""
         self.game.pause_music()
         self.game.play_sound(SoundName.LEVEL_COMPLETE)
         self.game.level_finished = True
         self.player_state = EntityState.GROUNDED_RIGHT
-        while self.rect.x < self.game.size[0]:
+        while self.game.camera.apply(self.rect).x < self.game.size[0]:
             self.rect.x += self.speed
             self.animate()
-            self.game.draw()
-        sleep(5)
+            yield
+        yield from wait(5)
         if self.game.current_map_id is not MapId.LEVEL_4_1:
             self.game.current_map_id = self.game.current_map_id.get_next_map()
             self.game.load_map()
         else:
             self.game.playing = False
             self.game.victory_screen()
-
@@ -1,23 +1,37 @@
 """Contains all spritesheets"""
 import pygame
 from misc.colours import Colour
+from misc.assets import assets
 from enum import Enum, auto
 
 
 class SpriteSheet:
-    """Contains info about spritesheet. Example file_location: 'img/main_character.png'."""
+    """Contains info about spritesheet. Example file_location: 'img/main_character.png'. The image is decoded in the
+    background by the asset manager, and only waited for the first time a sprite is cut out of it."""
     def __init__(self, file_location, bg_colour=Colour.BLACK):
-        self.sheet = pygame.image.load(file_location).convert()
+        self.file_location = file_location
+        assets.preload_image(file_location)
         self.name = file_location[4:-4]  # To remove "img/" from the beginning of the file_name and ".png" from the end
         self.bg_colour = bg_colour  # To remove a background colour of the image and make that part transparent.
+        self.sprite_cache = {}  # (x, y, width, height) -> sprite, so each sprite is only cut out of the sheet once
+
+    @property
+    def sheet(self) -> pygame.Surface:
+        return assets.get_image(self.file_location)
 
     def get_specific_sprite(self, x, y, width, height):
         """Searches sprite sheet for desired sprite image using x,y coordinates of top left corner of sprite and its
         width and height. Retrieves this sprite image and makes its background colour transparent. Returns sprite to
-        presumably the entity class the spritesheet is of (e.g returns the player_group sprite to the player_group class)."""
-        sprite = pygame.Surface([width, height])
-        sprite.blit(self.sheet, (0, 0), (x, y, width, height))
-        sprite.set_colorkey(self.bg_colour)
+        presumably the entity class the spritesheet is of (e.g returns the player_group sprite to the player_group class).
+        The same surface is returned every time for the same sprite, so it must never be drawn onto."""
+        key = (x, y, width, height)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface([width, height])
+            sprite.blit(self.sheet, (0, 0), (x, y, width, height))
+            sprite = sprite.convert()  # Matches the display's pixel format so it doesn't need converting every blit
+            sprite.set_colorkey(self.bg_colour, pygame.RLEACCEL)
+            self.sprite_cache[key] = sprite
         return sprite
 
     def __repr__(self):
@@ -52,7 +66,8 @@ class SpriteSheetName(Enum):
 
 def load_overworld_spritesheets():
     """Goes through the "SpriteSheetName" enum, creates spritesheet objects for all of them and then puts them all in
-    one dictionary which will be passed onto the 'game' class"""
+    one dictionary which will be passed onto the 'game' class. The images all start decoding at once in the
+    background."""
     file_names = [name for name in SpriteSheetName]
     spritesheets = {}
     for f_name in file_names:  # f_name is a SpriteSheetName enum
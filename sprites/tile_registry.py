@@ -0,0 +1,58 @@
+"""Contains the tile registry, which says which entity each character in a map's blueprint creates. A new kind of tile
+only needs a 'register_tile' line here for it to be usable in maps."""
+from time import perf_counter
+
+from sprites.all_sprites import Block, Underground, InvisibleWall, Player, Snake, Pipe, Ground, Key, Brick, Shroom,\
+    Bee, Rabbit, EnemyDisappearingBlock, GoalDisappearingBlock, Coin, RotationDirection, GoalLandingBlock
+
+tile_types = {}  # character -> (entity class, extra arguments given to create_instances)
+
+
+def register_tile(character: str, entity_class, *args):
+    """Makes the character create an entity_class at its position in the map, with args as extra constructor
+    arguments"""
+    tile_types[character] = (entity_class, args)
+
+
+register_tile("b", Block)
+register_tile("q", Block)
+register_tile("B", Brick)
+register_tile("G", Ground)
+register_tile("U", Underground)
+
+register_tile("d", EnemyDisappearingBlock)
+register_tile("D", GoalDisappearingBlock)
+register_tile("g", GoalLandingBlock)
+register_tile("I", InvisibleWall)
+register_tile("P", Player)
+
+register_tile("K", Key)
+register_tile("C", Coin)
+
+register_tile("s", Snake)
+register_tile("S", Shroom)
+register_tile("z", Bee)
+register_tile("R", Rabbit)
+
+register_tile("v", Pipe, RotationDirection.UP)
+register_tile("V", Pipe, RotationDirection.DOWN)
+register_tile("h", Pipe, RotationDirection.LEFT)
+register_tile("H", Pipe, RotationDirection.RIGHT)
+
+
+def create_tiles(game, items) -> dict:
+    """Creates the entities for a map's (x, y, character) items, creating all the entities for each character
+    together. Characters that aren't registered are ignored. Returns how long it took to create each entity class, in
+    seconds."""
+    positions = {}  # character -> [(x, y), ...]
+    for x, y, character in items:
+        if character in tile_types:
+            positions.setdefault(character, []).append((x, y))
+
+    load_times = {}
+    for character, character_positions in positions.items():
+        entity_class, args = tile_types[character]
+        start = perf_counter()
+        entity_class.create_instances(game, character_positions, *args)
+        load_times[entity_class.__name__] = load_times.get(entity_class.__name__, 0) + perf_counter() - start
+    return load_times